@@ -3,6 +3,15 @@ import numpy as np
 import queue
 import threading
 import time
+import math
+
+def _rms(x):
+    """Root-mean-square via a single BLAS dot product.
+
+    np.sqrt(np.mean(x**2)) materializes a squared temporary and streams the
+    data twice; np.dot reads it once with SIMD and allocates nothing.
+    """
+    return math.sqrt(float(np.dot(x, x)) / x.size) if x.size else 0.0
 
 class AudioCapture:
     def __init__(self, device_index=None, sample_rate=16000, chunk_duration=0.1, 
@@ -89,14 +98,19 @@ class AudioCapture:
         print(f"[Audio] Starting raw processing stream (step={self.streaming_step_size}s)")
         
         try:
-            with sd.InputStream(device=self.device_index, channels=1, samplerate=self.sample_rate, 
-                                blocksize=block_size, dtype='float32') as stream:
+            # RawInputStream hands back the PortAudio buffer as raw bytes;
+            # np.frombuffer wraps it without copying (InputStream.read built
+            # a fresh 2-D array per block that flatten() copied again). The
+            # yielded view is only valid until the next read — the pipeline
+            # copies it into its ring buffer immediately.
+            with sd.RawInputStream(device=self.device_index, channels=1, samplerate=self.sample_rate,
+                                   blocksize=block_size, dtype='float32') as stream:
                  self.running = True
                  while self.running:
                      data, overflow = stream.read(block_size)
                      if overflow:
                          print("Audio overflow")
-                     yield data.flatten()
+                     yield np.frombuffer(data, dtype=np.float32)
         except Exception as e:
             print(f"\n[ERROR] Audio Device Initialization Failed: {e}")
             print("Possible causes:")
@@ -149,7 +163,7 @@ class AudioCapture:
                 if time.time() - last_emit_time >= self.streaming_interval:
                     if len(buffer) > 0:
                         # Check if there's any audio (not pure silence)
-                        rms = np.sqrt(np.mean(buffer**2))
+                        rms = _rms(buffer)
                         if rms > self.silence_threshold * 0.5:  # Lower threshold for streaming
                             duration = len(buffer) / self.sample_rate
                             print(f"[Audio] Streaming emit: {duration:.2f}s, RMS={rms:.4f}")
@@ -178,7 +192,7 @@ class AudioCapture:
             audio_chunk = indata.copy().flatten()
             
             # Simple VAD: Check RMS (Root Mean Square) amplitude
-            rms = np.sqrt(np.mean(audio_chunk**2))
+            rms = _rms(audio_chunk)
             
             # Communicate via non-local variables (or just process here)
             # Since callback is in a separate thread managed by sounddevice, 
@@ -201,8 +215,8 @@ class AudioCapture:
             while self.running:
                 audio_chunk, overflow = stream.read(self.block_size)
                 audio_chunk = audio_chunk.flatten()
-                
-                rms = np.sqrt(np.mean(audio_chunk**2))
+
+                rms = _rms(audio_chunk)
                 max_rms_seen = max(max_rms_seen, rms)
                 
                 # Debug logging every 2 seconds
@@ -6,6 +6,26 @@ Replaces manual Audio MIDI Setup operations
 
 import platform
 import subprocess
+import time
+
+# Cached sounddevice enumeration shared by the dashboard and the manager.
+# Repeated PortAudio/CoreAudio enumeration is slow (and crash-prone on some
+# backends), so results are memoized for a few seconds; the refresh buttons
+# invalidate explicitly.
+_device_cache = {"devices": None, "ts": 0.0}
+
+def query_devices_cached(max_age=5.0):
+    """Return sd.query_devices(), reusing a recent result if available"""
+    import sounddevice as sd
+    now = time.monotonic()
+    if _device_cache["devices"] is None or now - _device_cache["ts"] > max_age:
+        _device_cache["devices"] = sd.query_devices()
+        _device_cache["ts"] = now
+    return _device_cache["devices"]
+
+def invalidate_device_cache():
+    """Force the next query_devices_cached() call to re-enumerate"""
+    _device_cache["ts"] = 0.0
 
 class AudioDeviceManager:
     def __init__(self):
@@ -25,8 +45,7 @@ class AudioDeviceManager:
         """Get list of all output audio devices"""
         devices = []
         try:
-            import sounddevice as sd
-            sd_devices = sd.query_devices()
+            sd_devices = query_devices_cached()
             for i, d in enumerate(sd_devices):
                 if d['max_output_channels'] > 0:
                     devices.append({
@@ -43,9 +62,8 @@ class AudioDeviceManager:
         virtual_devices = []
         
         try:
-            import sounddevice as sd
-            devices = sd.query_devices()
-            
+            devices = query_devices_cached()
+
             # Look for virtual audio devices
             virtual_keywords = ['blackhole', 'loopback', 'virtual', 'vb-cable', 'voicemeeter']
             
@@ -3,11 +3,15 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QTabWidget, QSpinBox, QDoubleSpinBox, QGridLayout,
                              QScrollArea, QSizePolicy, QSpacerItem, QFormLayout, QApplication,
                              QMessageBox, QTextEdit, QDialog)
-from PyQt6.QtCore import Qt, QSize, pyqtSignal, QThread
+from PyQt6.QtCore import Qt, QSize, pyqtSignal, QThread, QTimer
 from PyQt6.QtGui import QFont, QIcon, QColor
 import sys
-import sounddevice as sd
 from config import config
+from overlay_window import OverlayWindow
+
+# NOTE: sounddevice is intentionally NOT imported at module level — importing
+# it initializes PortAudio, which can be slow on some hosts. Device queries go
+# through audio_device_manager.query_devices_cached, which imports it lazily.
 
 # Modern QSS Styles
 STYLESHEET = """
@@ -57,7 +61,9 @@ QPushButton:hover {
     background-color: #b4befe;
 }
 QPushButton#StopButton {
+    font-size: 16px;
     background-color: #f38ba8;
+    border-radius: 10px;
 }
 QPushButton#StopButton:hover {
     background-color: #eba0ac;
@@ -74,8 +80,176 @@ QGroupBox::title {
     padding: 0 5px;
     color: #fab387;
 }
+QLabel#Header {
+    font-size: 24px;
+    font-weight: bold;
+    color: #89b4fa;
+}
+QLabel#SectionHeader {
+    font-size: 16px;
+    font-weight: bold;
+    color: #fab387;
+}
+QLabel#InfoMuted {
+    color: #6c7086;
+    font-style: italic;
+}
+QLabel#InfoSmall {
+    color: #6c7086;
+    font-size: 12px;
+    font-style: italic;
+}
+QLabel#HelpBox {
+    background-color: #313244;
+    padding: 10px;
+    border-radius: 5px;
+    font-size: 12px;
+}
+QLabel#StatusLabel {
+    font-size: 18px;
+    color: #a6e3a1;
+}
+QLabel#StatusLabel[state="warn"] {
+    color: #fab387;
+}
+QLabel#StatusLabel[state="err"] {
+    color: #f38ba8;
+}
+QLabel#DeviceStatus {
+    color: #a6e3a1;
+    font-style: italic;
+    padding: 10px;
+}
+QLabel#DeviceStatus[state="warn"] {
+    color: #fab387;
+}
+QLabel#DeviceStatus[state="err"] {
+    color: #f38ba8;
+}
+QPushButton#LaunchButton {
+    font-size: 16px;
+    background-color: #89b4fa;
+    border-radius: 10px;
+}
+QPushButton#SaveButton, QPushButton#CreateDeviceButton {
+    background-color: #a6e3a1;
+    color: #1e1e2e;
+    font-weight: bold;
+}
+QLabel#DialogTitle {
+    font-size: 18px;
+    font-weight: bold;
+    color: #89b4fa;
+    padding: 10px;
+}
+QTextEdit#InstructionsView {
+    background-color: #1e1e2e;
+    color: #cdd6f4;
+    border: 1px solid #45475a;
+    border-radius: 8px;
+    padding: 15px;
+    font-size: 13px;
+}
+QPushButton#GotItButton {
+    background-color: #a6e3a1;
+    color: #1e1e2e;
+    font-weight: bold;
+    font-size: 14px;
+    border-radius: 6px;
+}
+QPushButton#GotItButton:hover {
+    background-color: #b4e4b4;
+}
+QComboBox[dim="true"] {
+    color: #6c7086;
+}
 """
 
+# Static HTML for the multi-output instructions dialog. Built once at import;
+# only the two device names vary per invocation (filled via str.format).
+_INSTRUCTIONS_TEMPLATE = """
+        <div style='font-family: Arial, sans-serif;'>
+        <h3 style='color: #fab387;'>✨ Audio MIDI Setup is opening...</h3>
+
+        <p style='color: #a6adc8;'><b>Follow these simple steps:</b></p>
+
+        <div style='background: #313244; padding: 12px; border-radius: 6px; margin: 10px 0;'>
+        <p style='color: #89b4fa; font-weight: bold;'>👉 Step 1: Find the Plus Button</p>
+        <p>In the Audio MIDI Setup window, look at the <b>bottom-left corner</b>.<br>
+        Click the <span style='background: #45475a; padding: 2px 8px; border-radius: 3px;'>[+]</span> button.</p>
+        </div>
+
+        <div style='background: #313244; padding: 12px; border-radius: 6px; margin: 10px 0;'>
+        <p style='color: #89b4fa; font-weight: bold;'>👉 Step 2: Create Multi-Output</p>
+        <p>From the menu that appears, select:<br>
+        <span style='color: #a6e3a1; font-weight: bold;'>“Create Multi-Output Device”</span></p>
+        </div>
+
+        <div style='background: #313244; padding: 12px; border-radius: 6px; margin: 10px 0;'>
+        <p style='color: #89b4fa; font-weight: bold;'>👉 Step 3: Select Devices</p>
+        <p>Check the boxes for these devices:<br>
+        ✅ <span style='color: #f9e2af;'>{output_device}</span> (your speakers)<br>
+        ✅ <span style='color: #f9e2af;'>{virtual_device}</span> (for capturing)</p>
+        </div>
+
+        <div style='background: #313244; padding: 12px; border-radius: 6px; margin: 10px 0;'>
+        <p style='color: #89b4fa; font-weight: bold;'>👉 Step 4: Configure Drift Correction</p>
+        <p><b style='color: #f38ba8;'>IMPORTANT:</b> Uncheck <b>“Drift Correction”</b> for <span style='color: #f9e2af;'>{output_device}</span><br>
+        (This allows you to hear the audio through your speakers)</p>
+        </div>
+
+        <div style='background: #313244; padding: 12px; border-radius: 6px; margin: 10px 0;'>
+        <p style='color: #89b4fa; font-weight: bold;'>👉 Step 5: Set as Default Output</p>
+        <p>Go to <b>System Settings → Sound</b><br>
+        Set the new <span style='color: #a6e3a1;'>Multi-Output Device</span> as your output device.</p>
+        </div>
+
+        <hr style='border: 1px solid #45475a; margin: 15px 0;'>
+
+        <p style='color: #6c7086; font-style: italic;'>
+        💡 <b>Tip:</b> You only need to do this once! The device will persist across reboots.<br>
+        After setup, you'll hear audio normally while the translator captures it in real-time.
+        </p>
+        </div>
+        """
+
+def _set_state(widget, state):
+    """Set the dynamic 'state' property and re-polish so QSS [state=...] rules apply.
+
+    Cheaper than setStyleSheet, which re-parses the sheet and recurses over
+    all descendants on every call.
+    """
+    if widget.property("state") == state:
+        return
+    widget.setProperty("state", state)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+def _set_dim(widget, dim):
+    """Toggle the 'dim' dynamic property (QComboBox[dim=true] greys the text)"""
+    if bool(widget.property("dim")) == dim:
+        return
+    widget.setProperty("dim", dim)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+_SSL_CTX = None
+
+def _ssl_context():
+    """Shared SSLContext for HTTP clients.
+
+    ssl.create_default_context() loads the system CA bundle from disk, which
+    takes tens of milliseconds — build it once and reuse it. Verification is
+    disabled to match the rest of the app (self-signed local servers).
+    """
+    global _SSL_CTX
+    if _SSL_CTX is None:
+        import ssl
+        _SSL_CTX = ssl.create_default_context()
+        _SSL_CTX.check_hostname = False
+        _SSL_CTX.verify_mode = ssl.CERT_NONE
+    return _SSL_CTX
+
 class Dashboard(QWidget):
     start_requested = pyqtSignal()
     stop_requested = pyqtSignal()
@@ -84,6 +258,8 @@ class Dashboard(QWidget):
         """Ensure total program quit when dashboard is closed"""
         self.status_label.setText("Stopping...")
         self.on_stop()
+        if self._httpx_client is not None:
+            self._httpx_client.close()
         # Force application exit
         QApplication.quit()
         event.accept()
@@ -92,7 +268,9 @@ class Dashboard(QWidget):
         super().__init__()
         self.setWindowTitle("Real-Time Translator - Control Center")
         self.setMinimumSize(600, 500)
-        self.setStyleSheet(STYLESHEET)
+        # Install the sheet once at application level so every window (and the
+        # instructions dialog) inherits it without re-parsing the QSS per widget.
+        QApplication.instance().setStyleSheet(STYLESHEET)
         
         # Main Layout
         self.layout = QVBoxLayout()
@@ -102,26 +280,48 @@ class Dashboard(QWidget):
         
         # Header
         header = QLabel("🎙️ Real-Time Translator")
-        header.setStyleSheet("font-size: 24px; font-weight: bold; color: #89b4fa;")
+        header.setObjectName("Header")
         self.layout.addWidget(header)
         
+        # Instructions dialog is built lazily on first use and reused
+        self._instructions_dialog = None
+
+        # True while a deferred device re-enumeration is scheduled
+        self._pending_refresh = False
+
+        # AudioDeviceManager is constructed lazily and shared across clicks
+        self._audio_manager = None
+
+        # Pooled HTTP client for model-list fetches (keeps the TLS connection alive)
+        self._httpx_client = None
+
+        # Cached ConfigParser for save_config (re-read only if the file changed)
+        self._cp = None
+        self._cp_mtime = None
+
         # Tabs
         self.tabs = QTabWidget()
         self.layout.addWidget(self.tabs)
         
         self.init_home_tab()
         self.init_audio_tab()
-        self.init_device_manager_tab()
-        self.init_transcription_tab()
-        self.init_translation_tab()
+
+        # Defer the remaining tabs until the user first opens them — the
+        # Device Manager tab in particular runs a CoreAudio enumeration on
+        # build, which otherwise lands in dashboard startup.
+        self._deferred_tabs = {}
+        for title, builder in [("🔧 Device Manager", self.init_device_manager_tab),
+                               ("📝 Transcription", self.init_transcription_tab),
+                               ("🈵 Translation", self.init_translation_tab)]:
+            index = self.tabs.addTab(QWidget(), title)
+            self._deferred_tabs[index] = builder
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         
         # Footer Actions
         footer = QHBoxLayout()
         self.save_btn = QPushButton("Save Settings")
+        self.save_btn.setObjectName("SaveButton")
         self.save_btn.clicked.connect(self.save_config)
-        self.save_btn.setStyleSheet("""
-            background-color: #a6e3a1; color: #1e1e2e;
-        """)
         footer.addStretch()
         footer.addWidget(self.save_btn)
         self.layout.addLayout(footer)
@@ -133,28 +333,25 @@ class Dashboard(QWidget):
         layout.setSpacing(20)
         
         self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet("font-size: 18px; color: #a6e3a1;")
+        self.status_label.setObjectName("StatusLabel")
         layout.addWidget(self.status_label)
         
-        btn_layout = QHBoxLayout()
-        
         self.start_btn = QPushButton("▶ Launch Translator")
+        self.start_btn.setObjectName("LaunchButton")
         self.start_btn.setFixedSize(200, 60)
-        self.start_btn.setStyleSheet("font-size: 16px; background-color: #89b4fa; border-radius: 10px;")
         self.start_btn.clicked.connect(self.on_start)
-        
+
         self.stop_btn = QPushButton("⏹ Stop Translator")
+        self.stop_btn.setObjectName("StopButton")
         self.stop_btn.setFixedSize(200, 60)
-        self.stop_btn.setStyleSheet("font-size: 16px; background-color: #f38ba8; border-radius: 10px;")
         self.stop_btn.clicked.connect(self.on_stop)
         self.stop_btn.hide()
         
-        layout.addLayout(btn_layout)
         layout.addWidget(self.start_btn)
         layout.addWidget(self.stop_btn)
         
         info = QLabel("The translator will open as an overlay window.\nYou can minimize this dashboard.")
-        info.setStyleSheet("color: #6c7086; font-style: italic;")
+        info.setObjectName("InfoMuted")
         layout.addWidget(info)
         
         tab.setLayout(layout)
@@ -174,7 +371,7 @@ class Dashboard(QWidget):
         # Refresh Button
         refresh_btn = QPushButton("🔄")
         refresh_btn.setFixedWidth(40)
-        refresh_btn.clicked.connect(self.populate_devices)
+        refresh_btn.clicked.connect(self._on_refresh_inputs_clicked)
         layout.addWidget(refresh_btn, 0, 2)
         
         # Sample Rate
@@ -211,11 +408,11 @@ class Dashboard(QWidget):
         
         # Header
         header = QLabel("Audio Device Manager")
-        header.setStyleSheet("font-size: 16px; font-weight: bold; color: #fab387;")
+        header.setObjectName("SectionHeader")
         layout.addWidget(header)
-        
+
         info = QLabel("Create multi-output devices to capture system audio + hear it through speakers")
-        info.setStyleSheet("color: #6c7086; font-size: 12px; font-style: italic;")
+        info.setObjectName("InfoSmall")
         layout.addWidget(info)
         
         # Available Devices List
@@ -238,13 +435,11 @@ class Dashboard(QWidget):
         btn_layout = QHBoxLayout()
         
         self.refresh_devices_btn = QPushButton("🔄 Refresh Devices")
-        self.refresh_devices_btn.clicked.connect(self.refresh_audio_devices)
+        self.refresh_devices_btn.clicked.connect(self._on_refresh_devices_clicked)
         btn_layout.addWidget(self.refresh_devices_btn)
         
         self.create_multi_output_btn = QPushButton("➕ Create Multi-Output Device")
-        self.create_multi_output_btn.setStyleSheet("""
-            background-color: #a6e3a1; color: #1e1e2e; font-weight: bold;
-        """)
+        self.create_multi_output_btn.setObjectName("CreateDeviceButton")
         self.create_multi_output_btn.clicked.connect(self.create_multi_output_device)
         btn_layout.addWidget(self.create_multi_output_btn)
         
@@ -257,7 +452,7 @@ class Dashboard(QWidget):
         
         # Status
         self.device_status = QLabel("Ready")
-        self.device_status.setStyleSheet("color: #a6e3a1; font-style: italic; padding: 10px;")
+        self.device_status.setObjectName("DeviceStatus")
         layout.addWidget(self.device_status)
         
         # Help text
@@ -273,16 +468,79 @@ class Dashboard(QWidget):
             "Without permissions, you'll see manual instructions (very easy!).</i>"
         )
         help_text.setWordWrap(True)
-        help_text.setStyleSheet("background-color: #313244; padding: 10px; border-radius: 5px; font-size: 12px;")
+        help_text.setObjectName("HelpBox")
         layout.addWidget(help_text)
         
         layout.addStretch()
         
         tab.setLayout(layout)
-        self.tabs.addTab(tab, "🔧 Device Manager")
-        
+
         # Initial population
         self.refresh_audio_devices()
+        return tab
+
+    def _on_tab_changed(self, index):
+        """Build a deferred tab on first visit, swapping out its placeholder"""
+        builder = self._deferred_tabs.pop(index, None)
+        if builder is None:
+            return
+        tab = builder()
+        title = self.tabs.tabText(index)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, tab, title)
+        self.tabs.setCurrentIndex(index)
+
+    def _ensure_all_tabs(self):
+        """Build any still-deferred tabs (save_config reads their widgets)"""
+        current = self.tabs.currentIndex()
+        for index in sorted(self._deferred_tabs):
+            builder = self._deferred_tabs.pop(index)
+            tab = builder()
+            title = self.tabs.tabText(index)
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, tab, title)
+        self.tabs.setCurrentIndex(current)
+
+    def _on_refresh_inputs_clicked(self):
+        """Explicit refresh: invalidate the enumeration cache, then repopulate"""
+        from audio_device_manager import invalidate_device_cache
+        invalidate_device_cache()
+        self.populate_devices()
+
+    def _on_refresh_devices_clicked(self):
+        """Explicit refresh: invalidate the enumeration cache, then repopulate"""
+        from audio_device_manager import invalidate_device_cache
+        invalidate_device_cache()
+        self._audio_manager = None
+        self.refresh_audio_devices()
+
+    @property
+    def audio_manager(self):
+        """Lazily constructed AudioDeviceManager, reused across clicks"""
+        if self._audio_manager is None:
+            from audio_device_manager import AudioDeviceManager
+            self._audio_manager = AudioDeviceManager()
+        return self._audio_manager
+
+    @staticmethod
+    def _refill_combo(combo, devices):
+        """Batch-refill a combo with {'name', 'id'} dicts (one addItems call,
+        signals and repaints suppressed while rebuilding)"""
+        combo.blockSignals(True)
+        combo.setUpdatesEnabled(False)
+        try:
+            combo.clear()
+            combo.addItems([device['name'] for device in devices])
+            for row, device in enumerate(devices):
+                combo.setItemData(row, device['id'])
+        finally:
+            combo.setUpdatesEnabled(True)
+            combo.blockSignals(False)
+
+    def _deferred_device_refresh(self):
+        """Run the refresh scheduled by create_multi_output_device"""
+        self._pending_refresh = False
+        self.refresh_audio_devices()
 
     def refresh_audio_devices(self):
         """Refresh the list of audio devices"""
@@ -290,50 +548,41 @@ class Dashboard(QWidget):
             import platform
             if platform.system() != "Darwin":
                 self.device_status.setText("⚠️ Device Manager only available on macOS")
-                self.device_status.setStyleSheet("color: #fab387;")
+                _set_state(self.device_status, "warn")
                 return
             
-            from audio_device_manager import AudioDeviceManager
-            manager = AudioDeviceManager()
-            
             # Get output devices
-            output_devices = manager.get_output_devices()
-            self.output_devices_list.clear()
-            for device in output_devices:
-                self.output_devices_list.addItem(f"{device['name']}", device['id'])
-            
+            output_devices = self.audio_manager.get_output_devices()
+            self._refill_combo(self.output_devices_list, output_devices)
+
             # Get virtual/BlackHole devices
-            virtual_devices = manager.get_virtual_devices()
-            self.virtual_devices_list.clear()
+            virtual_devices = self.audio_manager.get_virtual_devices()
             if not virtual_devices:
+                self.virtual_devices_list.clear()
                 self.virtual_devices_list.addItem("No BlackHole device found - Please install it")
                 self.device_status.setText("⚠️ BlackHole not found. Install: brew install blackhole-2ch")
-                self.device_status.setStyleSheet("color: #fab387;")
+                _set_state(self.device_status, "warn")
             else:
-                for device in virtual_devices:
-                    self.virtual_devices_list.addItem(f"{device['name']}", device['id'])
+                self._refill_combo(self.virtual_devices_list, virtual_devices)
                 self.device_status.setText("✅ Devices loaded successfully")
-                self.device_status.setStyleSheet("color: #a6e3a1;")
+                _set_state(self.device_status, "ok")
                 
         except ImportError:
             self.device_status.setText("⚠️ Audio device management requires PyObjC (pip install pyobjc-framework-CoreAudio)")
-            self.device_status.setStyleSheet("color: #f38ba8;")
+            _set_state(self.device_status, "err")
         except Exception as e:
             self.device_status.setText(f"❌ Error: {str(e)}")
-            self.device_status.setStyleSheet("color: #f38ba8;")
+            _set_state(self.device_status, "err")
     
     def create_multi_output_device(self):
         """Create a multi-output device combining speakers + BlackHole"""
         try:
-            from audio_device_manager import AudioDeviceManager
-            manager = AudioDeviceManager()
-            
             output_device_id = self.output_devices_list.currentData()
             virtual_device_id = self.virtual_devices_list.currentData()
             
             if not output_device_id or not virtual_device_id:
                 self.device_status.setText("⚠️ Please select both devices")
-                self.device_status.setStyleSheet("color: #fab387;")
+                _set_state(self.device_status, "warn")
                 return
             
             # Show instruction dialog
@@ -341,7 +590,7 @@ class Dashboard(QWidget):
             
             # Call the audio device manager to open Audio MIDI Setup
             device_name = f"Translator Multi-Output"
-            success = manager.create_multi_output_device(
+            success = self.audio_manager.create_multi_output_device(
                 device_name,
                 [output_device_id, virtual_device_id],
                 silent=True  # Suppress console output, show GUI dialog instead
@@ -349,203 +598,167 @@ class Dashboard(QWidget):
             
             if success:
                 self.device_status.setText(f"✅ Audio MIDI Setup opened - Follow the instructions!")
-                self.device_status.setStyleSheet("color: #a6e3a1;")
-                # Refresh after user has time to create the device
-                QTimer = __import__('PyQt6.QtCore', fromlist=['QTimer']).QTimer
-                QTimer.singleShot(3000, self.refresh_audio_devices)
+                _set_state(self.device_status, "ok")
+                # Refresh after user has time to create the device.
+                # Coalesce repeated clicks into a single deferred re-enumeration.
+                if not self._pending_refresh:
+                    self._pending_refresh = True
+                    QTimer.singleShot(3000, self._deferred_device_refresh)
             else:
                 self.device_status.setText("❌ Failed to open Audio MIDI Setup")
-                self.device_status.setStyleSheet("color: #f38ba8;")
+                _set_state(self.device_status, "err")
                 
         except Exception as e:
             self.device_status.setText(f"❌ Error: {str(e)}")
-            self.device_status.setStyleSheet("color: #f38ba8;")
+            _set_state(self.device_status, "err")
     
     def _show_multi_output_instructions(self):
-        """Show a dialog with step-by-step instructions"""
-        dialog = QDialog(self)
-        dialog.setWindowTitle("🎵 Create Multi-Output Device - Instructions")
-        dialog.setMinimumSize(600, 500)
-        dialog.setStyleSheet(STYLESHEET)
-        
-        layout = QVBoxLayout()
-        
-        # Title
-        title = QLabel("📋 Step-by-Step Guide")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; color: #89b4fa; padding: 10px;")
-        layout.addWidget(title)
-        
-        # Instructions text
-        instructions = QTextEdit()
-        instructions.setReadOnly(True)
-        instructions.setStyleSheet("""
-            QTextEdit {
-                background-color: #1e1e2e;
-                color: #cdd6f4;
-                border: 1px solid #45475a;
-                border-radius: 8px;
-                padding: 15px;
-                font-size: 13px;
-                line-height: 1.6;
-            }
-        """)
-        
+        """Show a dialog with step-by-step instructions (dialog built once, reused)"""
+        if self._instructions_dialog is None:
+            dialog = QDialog(self)
+            dialog.setWindowTitle("\U0001f3b5 Create Multi-Output Device - Instructions")
+            dialog.setMinimumSize(600, 500)
+
+            layout = QVBoxLayout()
+
+            # Title
+            title = QLabel("\U0001f4cb Step-by-Step Guide")
+            title.setObjectName("DialogTitle")
+            layout.addWidget(title)
+
+            # Instructions text
+            instructions = QTextEdit()
+            instructions.setObjectName("InstructionsView")
+            instructions.setReadOnly(True)
+            # Display-only: skipping selection/interaction saves layout work
+            instructions.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+            layout.addWidget(instructions)
+
+            # Close button
+            close_btn = QPushButton("\u2705 Got it!")
+            close_btn.setObjectName("GotItButton")
+            close_btn.setFixedHeight(40)
+            close_btn.clicked.connect(dialog.accept)
+            layout.addWidget(close_btn)
+
+            dialog.setLayout(layout)
+            self._instructions_dialog = dialog
+            self._instructions_view = instructions
+            self._instructions_devices = None
+
         output_device = self.output_devices_list.currentText()
         virtual_device = self.virtual_devices_list.currentText()
-        
-        instructions_html = f"""
-        <div style='font-family: Arial, sans-serif;'>
-        <h3 style='color: #fab387;'>✨ Audio MIDI Setup is opening...</h3>
-        
-        <p style='color: #a6adc8;'><b>Follow these simple steps:</b></p>
-        
-        <div style='background: #313244; padding: 12px; border-radius: 6px; margin: 10px 0;'>
-        <p style='color: #89b4fa; font-weight: bold;'>👉 Step 1: Find the Plus Button</p>
-        <p>In the Audio MIDI Setup window, look at the <b>bottom-left corner</b>.<br>
-        Click the <span style='background: #45475a; padding: 2px 8px; border-radius: 3px;'>[+]</span> button.</p>
-        </div>
-        
-        <div style='background: #313244; padding: 12px; border-radius: 6px; margin: 10px 0;'>
-        <p style='color: #89b4fa; font-weight: bold;'>👉 Step 2: Create Multi-Output</p>
-        <p>From the menu that appears, select:<br>
-        <span style='color: #a6e3a1; font-weight: bold;'>“Create Multi-Output Device”</span></p>
-        </div>
-        
-        <div style='background: #313244; padding: 12px; border-radius: 6px; margin: 10px 0;'>
-        <p style='color: #89b4fa; font-weight: bold;'>👉 Step 3: Select Devices</p>
-        <p>Check the boxes for these devices:<br>
-        ✅ <span style='color: #f9e2af;'>{output_device}</span> (your speakers)<br>
-        ✅ <span style='color: #f9e2af;'>{virtual_device}</span> (for capturing)</p>
-        </div>
-        
-        <div style='background: #313244; padding: 12px; border-radius: 6px; margin: 10px 0;'>
-        <p style='color: #89b4fa; font-weight: bold;'>👉 Step 4: Configure Drift Correction</p>
-        <p><b style='color: #f38ba8;'>IMPORTANT:</b> Uncheck <b>“Drift Correction”</b> for <span style='color: #f9e2af;'>{output_device}</span><br>
-        (This allows you to hear the audio through your speakers)</p>
-        </div>
-        
-        <div style='background: #313244; padding: 12px; border-radius: 6px; margin: 10px 0;'>
-        <p style='color: #89b4fa; font-weight: bold;'>👉 Step 5: Set as Default Output</p>
-        <p>Go to <b>System Settings → Sound</b><br>
-        Set the new <span style='color: #a6e3a1;'>Multi-Output Device</span> as your output device.</p>
-        </div>
-        
-        <hr style='border: 1px solid #45475a; margin: 15px 0;'>
-        
-        <p style='color: #6c7086; font-style: italic;'>
-        💡 <b>Tip:</b> You only need to do this once! The device will persist across reboots.<br>
-        After setup, you'll hear audio normally while the translator captures it in real-time.
-        </p>
-        </div>
-        """
-        
-        instructions.setHtml(instructions_html)
-        layout.addWidget(instructions)
-        
-        # Close button
-        close_btn = QPushButton("✅ Got it!")
-        close_btn.setFixedHeight(40)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #a6e3a1;
-                color: #1e1e2e;
-                font-weight: bold;
-                font-size: 14px;
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background-color: #b4e4b4;
-            }
-        """)
-        close_btn.clicked.connect(dialog.accept)
-        layout.addWidget(close_btn)
-        
-        dialog.setLayout(layout)
-        dialog.exec()
-    
+
+        # Re-run the HTML parse only when the device names actually changed.
+        # Repaints are held back while the document is parsed and laid out.
+        if self._instructions_devices != (output_device, virtual_device):
+            self._instructions_view.setUpdatesEnabled(False)
+            try:
+                self._instructions_view.setHtml(_INSTRUCTIONS_TEMPLATE.format(
+                    output_device=output_device, virtual_device=virtual_device))
+            finally:
+                self._instructions_view.setUpdatesEnabled(True)
+            self._instructions_devices = (output_device, virtual_device)
+
+        self._instructions_dialog.exec()
+
     def set_default_output_device(self):
         """Set the selected device as system default output"""
         try:
-            from audio_device_manager import AudioDeviceManager
-            manager = AudioDeviceManager()
-            
             device_id = self.output_devices_list.currentData()
             if not device_id:
                 self.device_status.setText("⚠️ Please select a device")
-                self.device_status.setStyleSheet("color: #fab387;")
+                _set_state(self.device_status, "warn")
                 return
             
             device_name = self.output_devices_list.currentText()
-            success = manager.set_default_output_device(device_id)
+            success = self.audio_manager.set_default_output_device(device_id)
             
             if success:
                 self.device_status.setText(f"✅ Set '{device_name}' as default output")
-                self.device_status.setStyleSheet("color: #a6e3a1;")
+                _set_state(self.device_status, "ok")
             else:
                 self.device_status.setText("❌ Failed to set default device")
-                self.device_status.setStyleSheet("color: #f38ba8;")
+                _set_state(self.device_status, "err")
                 
         except Exception as e:
             self.device_status.setText(f"❌ Error: {str(e)}")
-            self.device_status.setStyleSheet("color: #f38ba8;")
+            _set_state(self.device_status, "err")
 
     def refresh_model_list(self):
         """Fetch available models from the API and populate the model dropdown"""
+        api_key = self.api_key.text() or "dummy-key-for-local"
+        base_url = self.base_url.text() or None
+
+        # Update button state
+        self.refresh_models_btn.setEnabled(False)
+        self.refresh_models_btn.setText("...")
+
+        # Run the HTTPS request on a worker thread so the dashboard stays responsive
+        self._models_fetcher = ModelsFetcher(api_key, base_url, self._http_client())
+        self._models_fetcher.done.connect(self._on_models_loaded)
+        self._models_fetcher.failed.connect(self._on_models_error)
+        self._models_fetcher.start()
+
+    def _on_models_loaded(self, model_ids):
+        """Populate the model combo with the fetched list (main thread)"""
+        # Update combo box (batched; suppress intermediate currentTextChanged)
+        current_model = self.model.currentText()
+        self.model.blockSignals(True)
+        self.model.setUpdatesEnabled(False)
         try:
-            from openai import OpenAI
-            import httpx
-            
-            api_key = self.api_key.text() or "dummy-key-for-local"
-            base_url = self.base_url.text() or None
-            
-            # Update button state
-            self.refresh_models_btn.setEnabled(False)
-            self.refresh_models_btn.setText("...")
-            
-            # Create client with SSL verification disabled
-            http_client = httpx.Client(verify=False)
-            client = OpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
-            
-            # Fetch models
-            models_response = client.models.list()
-            model_ids = [model.id for model in models_response.data]
-            
-            # Update combo box
-            current_model = self.model.currentText()
             self.model.clear()
-            
+
             if model_ids:
-                self.model.addItems(sorted(model_ids))
-                # Try to restore previous selection
-                index = self.model.findText(current_model)
+                sorted_ids = sorted(model_ids)
+                self.model.addItems(sorted_ids)
+                # Try to restore previous selection (dict beats findText's O(N) scan)
+                idx_map = {m: i for i, m in enumerate(sorted_ids)}
+                index = idx_map.get(current_model, -1)
                 if index >= 0:
                     self.model.setCurrentIndex(index)
-                    
-                # Show success in status label if we're on the home tab
-                if hasattr(self, 'status_label'):
-                    self.status_label.setText(f"✅ Loaded {len(model_ids)} models")
-                    self.status_label.setStyleSheet("font-size: 18px; color: #a6e3a1;")
             else:
                 self.model.addItem(current_model)
-                if hasattr(self, 'status_label'):
-                    self.status_label.setText("⚠️ No models found")
-                    self.status_label.setStyleSheet("font-size: 18px; color: #fab387;")
-            
-        except Exception as e:
-            # Restore original model on error
-            if not self.model.currentText():
-                self.model.addItem(config.model)
-            
-            error_msg = str(e)
-            if hasattr(self, 'status_label'):
-                self.status_label.setText(f"❌ Failed to fetch models: {error_msg[:50]}")
-                self.status_label.setStyleSheet("font-size: 18px; color: #f38ba8;")
-            print(f"[Dashboard] Model refresh error: {error_msg}")
-        
         finally:
-            # Restore button state
-            self.refresh_models_btn.setEnabled(True)
-            self.refresh_models_btn.setText("🔄")
+            self.model.setUpdatesEnabled(True)
+            self.model.blockSignals(False)
+
+        if model_ids:
+            # Show success in status label if we're on the home tab
+            if hasattr(self, 'status_label'):
+                self.status_label.setText(f"\u2705 Loaded {len(model_ids)} models")
+                _set_state(self.status_label, "ok")
+        else:
+            if hasattr(self, 'status_label'):
+                self.status_label.setText("\u26a0\ufe0f No models found")
+                _set_state(self.status_label, "warn")
+
+        self._restore_models_btn()
+
+    def _on_models_error(self, error_msg):
+        """Handle a failed model fetch (main thread)"""
+        # Restore original model on error
+        if not self.model.currentText():
+            self.model.addItem(config.model)
+
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(f"\u274c Failed to fetch models: {error_msg[:50]}")
+            _set_state(self.status_label, "err")
+        print(f"[Dashboard] Model refresh error: {error_msg}")
+
+        self._restore_models_btn()
+
+    def _http_client(self):
+        """Lazily created httpx.Client, pooled so repeated refreshes reuse the
+        same TCP+TLS connection instead of handshaking per click"""
+        if self._httpx_client is None:
+            import httpx
+            self._httpx_client = httpx.Client(verify=_ssl_context(), timeout=10.0)
+        return self._httpx_client
+
+    def _restore_models_btn(self):
+        self.refresh_models_btn.setEnabled(True)
+        self.refresh_models_btn.setText("\U0001f504")
 
     def init_transcription_tab(self):
         tab = QWidget()
@@ -600,7 +813,7 @@ class Dashboard(QWidget):
         layout.addRow("Compute Device:", self.device_type)
         
         self.compute_type = QComboBox()
-        self.compute_type.addItems(["int8", "float16", "float32"])
+        self.compute_type.addItems(["auto", "int8", "float16", "float32"])
         self.compute_type.setCurrentText(config.whisper_compute_type)
         self.compute_type.currentTextChanged.connect(self._on_quantization_changed)
         layout.addRow("Quantization:", self.compute_type)
@@ -617,7 +830,7 @@ class Dashboard(QWidget):
         self._on_backend_changed(config.asr_backend)
         
         tab.setLayout(layout)
-        self.tabs.addTab(tab, "📝 Transcription")
+        return tab
     
     def _on_backend_changed(self, backend):
         """Show/hide model selectors based on backend and warn about device compatibility"""
@@ -629,12 +842,8 @@ class Dashboard(QWidget):
         self.funasr_model.setEnabled(is_funasr)
         
         # Visual feedback - dim disabled widgets
-        if is_whisper_or_mlx:
-            self.whisper_model.setStyleSheet("")
-            self.funasr_model.setStyleSheet("color: #6c7086;")
-        else:
-            self.whisper_model.setStyleSheet("color: #6c7086;")
-            self.funasr_model.setStyleSheet("")
+        _set_dim(self.whisper_model, not is_whisper_or_mlx)
+        _set_dim(self.funasr_model, not is_funasr)
         
         # Check MPS + FunASR quantization compatibility
         if is_funasr:
@@ -714,37 +923,84 @@ class Dashboard(QWidget):
         layout.addRow("Target Language:", self.target_lang)
         
         tab.setLayout(layout)
-        self.tabs.addTab(tab, "🈵 Translation")
+        return tab
 
     def populate_devices(self):
+        """Kick off async device enumeration (PortAudio queries can block for >1s)"""
+        # Rebinding _device_worker while a fetch is in flight would drop the
+        # only reference to a live QThread, which aborts the app — let the
+        # running enumeration finish and deliver instead
+        worker = getattr(self, '_device_worker', None)
+        if worker is not None and worker.isRunning():
+            return
+
         self.device_combo.clear()
-        self.device_combo.addItem("Auto (Default)", "auto")
-        
+        self.device_combo.addItem("Loading devices...", None)
+        self.device_combo.setEnabled(False)
+
+        # Run sd.query_devices() on a worker thread so the dashboard doesn't freeze
+        self._device_worker = DeviceEnumerator()
+        self._device_worker.devices_ready.connect(self._on_devices_ready)
+        self._device_worker.start()
+
+    def _on_devices_ready(self, input_devices, error):
+        """Fill the input-device combo from the enumerator result (main thread)"""
+        combo = self.device_combo
+        combo.blockSignals(True)
+        combo.setUpdatesEnabled(False)
         try:
-            devices = sd.query_devices()
-            for i, d in enumerate(devices):
-                if d['max_input_channels'] > 0:
-                    name = f"[{i}] {d['name']}"
-                    self.device_combo.addItem(name, i) # Store index as data
-            
-            # Select current
-            if config.device_index is not None:
-                index = self.device_combo.findData(config.device_index)
-                if index >= 0:
-                    self.device_combo.setCurrentIndex(index)
-        except Exception as e:
-            self.device_combo.addItem(f"Error: {e}")
+            combo.clear()
+            combo.addItem("Auto (Default)", "auto")
 
-    def save_config(self):
+            if error:
+                combo.addItem(f"Error: {error}")
+            else:
+                # Batch-insert, then attach the device indices as userData
+                combo.addItems([f"[{i}] {name}" for i, name in input_devices])
+                row_map = {}
+                for row, (i, _name) in enumerate(input_devices, start=1):
+                    combo.setItemData(row, i)
+                    row_map[i] = row
+
+                # Select current (dict beats findData's O(N) scan)
+                if config.device_index is not None:
+                    index = row_map.get(config.device_index, -1)
+                    if index >= 0:
+                        combo.setCurrentIndex(index)
+        finally:
+            combo.setUpdatesEnabled(True)
+            combo.blockSignals(False)
+
+        combo.setEnabled(True)
+
+    def _config_parser(self, config_path):
+        """Cached ConfigParser for config.ini; re-reads only when the file's
+        mtime changed since the last read (e.g. edited externally)"""
         import configparser
         import os
-        
+
+        try:
+            mtime = os.path.getmtime(config_path)
+        except OSError:
+            mtime = None
+
+        if self._cp is None or mtime != self._cp_mtime:
+            self._cp = configparser.ConfigParser()
+            self._cp.read(config_path)
+            self._cp_mtime = mtime
+        return self._cp
+
+    def save_config(self):
+        import os
+
+        # Deferred tabs own some of the widgets read below
+        self._ensure_all_tabs()
+
         # Update config object logic would go here, 
         # For now, we write directly to config.ini similarly to settings_window.py
-        
-        cp = configparser.ConfigParser()
+
         config_path = os.path.join(os.path.dirname(__file__), "config.ini")
-        cp.read(config_path)
+        cp = self._config_parser(config_path)
         
         if not cp.has_section("audio"): cp.add_section("audio")
         if not cp.has_section("api"): cp.add_section("api")
@@ -774,27 +1030,24 @@ class Dashboard(QWidget):
         
         with open(config_path, 'w') as f:
             cp.write(f)
-            
+        self._cp_mtime = os.path.getmtime(config_path)
+
         self.status_label.setText("Saved! Please restart.")
 
     def on_start(self):
         # 1. Update UI to Loading State
         self.status_label.setText("Initializing Pipeline... (This may take a moment)")
-        self.status_label.setStyleSheet("font-size: 18px; color: #fab387;") # Orange for loading
+        _set_state(self.status_label, "warn") # Orange for loading
         self.start_btn.setEnabled(False)
         self.start_btn.setText("Loading...")
         
         # 2. Start Worker Thread
-        from PyQt6.QtCore import QThread, pyqtSignal
         self.startup_worker = StartupWorker()
         self.startup_worker.finished.connect(self.on_pipeline_ready)
         self.startup_worker.start()
 
     def on_pipeline_ready(self, _, pipeline):
         # Create Window on Main Thread
-        from main import OverlayWindow
-        from config import config
-        
         if not pipeline:
              self.status_label.setText("Initialization Failed Check Console")
              self.start_btn.setEnabled(True)
@@ -817,7 +1070,7 @@ class Dashboard(QWidget):
         self.pipeline.start()
 
         self.status_label.setText("Running...")
-        self.status_label.setStyleSheet("font-size: 18px; color: #a6e3a1;")
+        _set_state(self.status_label, "ok")
         
         self.start_btn.hide()
         self.stop_btn.show()
@@ -840,13 +1093,60 @@ class Dashboard(QWidget):
         self.start_btn.setText("▶ Launch Translator")
         self.showNormal()
 
+class DeviceEnumerator(QThread):
+    """Enumerates audio input devices off the GUI thread.
+
+    PortAudio/WASAPI device enumeration can take hundreds of ms; running it
+    synchronously in populate_devices froze the dashboard on startup and on
+    every refresh click.
+    """
+    devices_ready = pyqtSignal(list, str)  # ([(index, name), ...], error)
+
+    def run(self):
+        try:
+            from audio_device_manager import query_devices_cached
+            devices = query_devices_cached()
+            inputs = [(i, d['name']) for i, d in enumerate(devices)
+                      if d['max_input_channels'] > 0]
+            self.devices_ready.emit(inputs, "")
+        except Exception as e:
+            self.devices_ready.emit([], str(e))
+
+class ModelsFetcher(QThread):
+    """Fetches the model list from the API endpoint off the GUI thread."""
+    done = pyqtSignal(list)
+    failed = pyqtSignal(str)
+
+    def __init__(self, api_key, base_url, http_client):
+        super().__init__()
+        self.api_key = api_key
+        self.base_url = base_url
+        self.http_client = http_client
+
+    def run(self):
+        try:
+            from openai import OpenAI
+
+            client = OpenAI(api_key=self.api_key, base_url=self.base_url,
+                            http_client=self.http_client)
+            models_response = client.models.list()
+            self.done.emit([model.id for model in models_response.data])
+        except Exception as e:
+            self.failed.emit(str(e))
+
 class StartupWorker(QThread):
     finished = pyqtSignal(object, object) # window(None), pipeline
 
     def run(self):
         try:
-            from main import Pipeline
-            pipeline = Pipeline()
+            from main import build_pipeline
+            pipeline = build_pipeline()
+            # The Pipeline QObject inherits this worker thread's affinity,
+            # and the thread dies right after the emit — slots bound to the
+            # pipeline (the partial flush timer's) would be queued into a
+            # dead event loop and never run. Push it to the GUI thread
+            # before handing it over (legal: a push from the owning thread).
+            pipeline.moveToThread(QApplication.instance().thread())
             self.finished.emit(None, pipeline)
         except Exception as e:
             print(f"Startup Error: {e}")
@@ -6,6 +6,9 @@ import signal
 import threading
 import queue
 import time
+import math
+import numpy as np
+from bisect import bisect_left
 from concurrent.futures import ThreadPoolExecutor
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
@@ -19,15 +22,56 @@ from config import config
 class WorkerSignals(QObject):
     update_text = pyqtSignal(int, str, str)  # (chunk_id, original, translated)
 
+def build_transcriber():
+    """Construct the Transcriber from config (model load: disk/compute bound)"""
+    print(f"[Pipeline] Initializing Transcriber with backend={config.asr_backend}, device={config.whisper_device}...")
+
+    # Determine model size based on backend
+    if config.asr_backend == "funasr":
+        model_size = config.funasr_model
+    else:
+        model_size = config.whisper_model
+
+    return Transcriber(
+        backend=config.asr_backend,
+        model_size=model_size,
+        device=config.whisper_device,
+        compute_type=config.whisper_compute_type,
+        language=config.source_language
+    )
+
+def build_translator():
+    """Construct the Translator from config (client setup: network bound)"""
+    print(f"[Pipeline] Initializing Translator (target={config.target_lang})...")
+    return Translator(
+        target_lang=config.target_lang,
+        base_url=config.api_base_url,
+        api_key=config.api_key,
+        model=config.model
+    )
+
+def build_pipeline():
+    """Build a Pipeline, loading Transcriber and Translator concurrently.
+
+    The model load hits disk/GPU while the translator init is network
+    bound, so cold start costs max() of the two instead of their sum.
+    """
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        f_asr = ex.submit(build_transcriber)
+        f_mt = ex.submit(build_translator)
+        transcriber = f_asr.result()
+        translator = f_mt.result()
+    return Pipeline(transcriber=transcriber, translator=translator)
+
 class Pipeline(QObject):
-    def __init__(self):
+    def __init__(self, transcriber=None, translator=None):
         super().__init__()
         self.signals = WorkerSignals()
         self.running = True
-        
+
         # Print config for debugging
         config.print_config()
-        
+
         # Initialize components
         self.audio = AudioCapture(
             device_index=config.device_index,
@@ -41,38 +85,102 @@ class Pipeline(QObject):
             streaming_step_size=config.streaming_step_size,
             streaming_overlap=config.streaming_overlap
         )
-        
-        # Initialize Transcriber
-        print(f"[Pipeline] Initializing Transcriber with backend={config.asr_backend}, device={config.whisper_device}...")
-        
-        # Determine model size based on backend
-        if config.asr_backend == "funasr":
-            model_size = config.funasr_model
-        else:
-            model_size = config.whisper_model
-            
-        self.transcriber = Transcriber(
-            backend=config.asr_backend,
-            model_size=model_size,
-            device=config.whisper_device,
-            compute_type=config.whisper_compute_type,
-            language=config.source_language
-        )
-        
-        # Initialize Translator
-        print(f"[Pipeline] Initializing Translator (target={config.target_lang})...")
-        self.translator = Translator(
-            target_lang=config.target_lang,
-            base_url=config.api_base_url,
-            api_key=config.api_key,
-            model=config.model
-        )
-        
-        # Warmup Transcriber (Critical for MLX/GPU)
-        self.transcriber.warmup()
+
+        # Accept pre-built stages (build_pipeline loads them in parallel);
+        # fall back to serial construction when called directly
+        self.transcriber = transcriber if transcriber is not None else build_transcriber()
+        self.translator = translator if translator is not None else build_translator()
+
+        # Preallocated phrase buffers. Appending into a fixed array is an
+        # O(chunk) memcpy; the old np.concatenate re-copied the whole phrase
+        # on every 0.2s chunk (quadratic traffic for long phrases).
+        # +1s of headroom so the append lands before the hard-limit cut fires.
+        # Two rings so a finalized phrase can be handed to the ASR consumer
+        # as a zero-copy view while new audio accumulates in the other.
+        # Stored as int16 (audio is 16-bit PCM at heart): half the bytes of
+        # float32, so buffer copies and cache footprint are halved too. The
+        # energy bookkeeping stays on the incoming float chunks, and slices
+        # convert back to float32 only at the transcription boundary.
+        capacity = int(config.sample_rate * config.max_phrase_duration) + config.sample_rate
+        self._bufs = [np.empty(capacity, dtype=np.int16),
+                      np.empty(capacity, dtype=np.int16)]
+        self._active = 0
+        self._buf = self._bufs[0]
+        self._ring_busy = [False, False]  # view still owned by the consumer
+        self._n = 0
+
+        # Rotating scratch for partial snapshots (converted into, never
+        # allocated per tick — float32 because the snapshot goes straight
+        # to the model). The producer overwrites a still-pending partial in
+        # place, reusing its slot, so at most one unread partial holds a
+        # slot at a time and a new snapshot never lands on audio the
+        # consumer hasn't read yet.
+        self._scratch = [np.empty(capacity, dtype=np.float32) for _ in range(3)]
+        self._scratch_idx = 0
+
+        # VAD constants — fixed for the session, so resolve them once
+        # instead of re-deriving sample counts on every 0.2s chunk
+        sr = config.sample_rate
+        self._tail_std = int(sr * config.silence_duration)
+        self._tail_soft = int(sr * 0.4)
+        self._min_finalize_samples = int(sr * 0.5)
+        self._min_standard_samples = int(sr * 2.0)
+        self._soft_limit_samples = int(sr * 6.0)
+        self._hard_limit_samples = int(sr * config.max_phrase_duration)
+        self._silence_thr2 = config.silence_threshold ** 2
+        # Integer nanoseconds: time.monotonic_ns is immune to wall-clock
+        # (NTP) jumps, unlike the time.time() floats used before
+        self._update_interval_ns = int(config.update_interval * 1e9)
+
+        # Coalesced partial-text emits: partials overwrite a slot here and a
+        # 50ms timer on the Qt thread flushes the newest one, so fast speech
+        # can't flood the GUI event queue with stale cross-thread signals
+        self._pending_emit = {}
+        self._emit_lock = threading.Lock()
+        self._emit_timer = None
+
+        # Running sum of squares plus one cumulative checkpoint per appended
+        # chunk. Tail RMS becomes a checkpoint subtraction and whole-buffer
+        # RMS is free — no re-squaring of audio that was already scanned.
+        self._ss = 0.0
+        self._mark_pos = []   # buffer position after each chunk
+        self._mark_ss = []    # cumulative sum of squares at that position
+
+        # Pending transcription tasks, drained by a single consumer thread.
+        # Partials for the same chunk id coalesce (only the newest matters),
+        # so backlog can't grow unbounded under fast speech; finals are
+        # never dropped and run in order.
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        # Number of partial transcriptions currently executing. While one is
+        # in flight the producer skips queueing another: its snapshot would
+        # already be stale by the time the model got to it. Finals are
+        # exempt — they must never be dropped.
+        self._partial_inflight = 0
+
+        # Bounded handoff between the ASR stage and the translation workers.
+        # maxsize gives backpressure: with 32 untranslated finals queued,
+        # the ASR consumer blocks rather than piling up more.
+        self.text_q = queue.Queue(maxsize=32)
+
+        # Warmup Transcriber (Critical for MLX/GPU). Runs on its own thread
+        # so startup doesn't block on a dummy inference — the overlay can
+        # appear while it runs; the ASR consumer waits on the future before
+        # its first real transcription.
+        self._warm_future = ThreadPoolExecutor(max_workers=1).submit(self.transcriber.warmup)
 
     def start(self):
         """Start the processing pipeline in a dedicated thread"""
+        # Flush timer for coalesced partial emits. Created here (not in
+        # __init__) because start() runs on the Qt main thread, while the
+        # Pipeline itself may be built on a StartupWorker thread that has
+        # no event loop for a timer to fire on. Parentless on purpose.
+        # The connected slot runs on the *receiver's* thread, so the
+        # Pipeline must live on the GUI thread by now too — StartupWorker
+        # pushes it there with moveToThread before handing it over.
+        self._emit_timer = QTimer()
+        self._emit_timer.timeout.connect(self._flush_partial_emits)
+        self._emit_timer.start(50)
         # self.audio.start() # DISABLE: Generator manages its own stream. calling this causes double-stream error on macOS
         self.thread = threading.Thread(target=self.processing_loop)
         self.thread.daemon = True
@@ -81,58 +189,67 @@ class Pipeline(QObject):
     def stop(self):
         print("\n[Pipeline] Stopping...")
         self.running = False
+        if self._emit_timer is not None:
+            self._emit_timer.stop()
         self.audio.stop()
         if self.thread.is_alive():
             self.thread.join(timeout=2)
         print("[Pipeline] Stopped.")
 
+    def _tail_ss(self, k):
+        """Sum of squares and length of roughly the last k samples.
+
+        Uses the per-chunk sum-of-squares checkpoints, so this is a bisect
+        plus one subtraction instead of re-scanning the tail. The window
+        start is rounded to the nearest chunk boundary (0.2s granularity),
+        which is well within VAD tolerance. Returning the raw sum lets
+        callers compare against threshold**2 * count without a sqrt.
+        """
+        cut = self._n - k
+        if cut <= 0:
+            return self._ss, self._n
+        j = bisect_left(self._mark_pos, cut)
+        if j > 0 and self._mark_pos[j] >= self._n:
+            j -= 1
+        start = self._mark_pos[j]
+        count = self._n - start
+        if count <= 0:
+            return 0.0, 0
+        return max(self._ss - self._mark_ss[j], 0.0), count
+
     def processing_loop(self):
-        """Fully parallel pipeline: multiple concurrent transcription + translation"""
-        print("Pipeline processing loop started (FULLY PARALLEL mode).")
-        
-        # Create multiple transcribers for concurrent processing
-        # CHECK: If using MLX, force 1 worker (MLX is not thread-safe for parallel inference in this way)
-        is_mlx = (config.asr_backend == "mlx")
-        
-        if is_mlx:
-            print("[Pipeline] MLX backend detected - forcing single worker (MLX uses GPU parallelism internaly)")
-            num_transcription_workers = 1
-        else:
-            num_transcription_workers = config.transcription_workers
-            
-        print(f"[Pipeline] Using {num_transcription_workers} transcription workers...")
-        
-        # Determine model size based on backend
-        if config.asr_backend == "funasr":
-            model_size = config.funasr_model
-        else:
-            model_size = config.whisper_model
-        
-        transcribers = [self.transcriber]  # Reuse existing one
-        for i in range(num_transcription_workers - 1):
-            t = Transcriber(
-                backend=config.asr_backend,
-                model_size=model_size,
-                device=config.whisper_device,
-                compute_type=config.whisper_compute_type,
-                language=config.source_language
-            )
-            transcribers.append(t)
         """Accumulating Buffer Processing Loop (Word-by-Word Streaming)"""
         print("[Pipeline] processing loop started (Accumulating Mode).")
-        
-        import numpy as np
-        
-        # Executors
-        transcribe_executor = ThreadPoolExecutor(max_workers=1) # Serial transcription
-        translate_executor = ThreadPoolExecutor(max_workers=config.translation_threads)
-        
-        # State
-        buffer = np.array([], dtype=np.float32)
+
+        # Stage workers: one ASR consumer, N translators draining text_q
+        consumer = threading.Thread(target=self._transcribe_consumer, daemon=True)
+        consumer.start()
+        translators = []
+        for _ in range(config.translation_threads):
+            t = threading.Thread(target=self._translate_worker, daemon=True)
+            t.start()
+            translators.append(t)
+
+        # State (audio accumulates in the preallocated self._buf)
+        self._n = 0
         chunk_id = 1
-        last_update_time = time.time()
-        phrase_start_time = time.time()
-        
+        last_update_ns = time.monotonic_ns()
+
+        # Hoist loop-invariant attribute loads: each self._x below is two
+        # LOAD_ATTRs per read and the loop fires ~5x/s for the whole session
+        tail_std = self._tail_std
+        tail_soft = self._tail_soft
+        min_finalize = self._min_finalize_samples
+        min_standard = self._min_standard_samples
+        soft_limit = self._soft_limit_samples
+        hard_limit = self._hard_limit_samples
+        thr2 = self._silence_thr2
+        update_interval_ns = self._update_interval_ns
+        silence_thr = self.audio.silence_threshold
+        mark_pos = self._mark_pos  # cleared in place, never rebound
+        mark_ss = self._mark_ss
+        last_voice_pos = 0  # buffer position just after the last energetic chunk
+
         # Generator yielding small chunks (e.g. 0.2s)
         audio_gen = self.audio.generator()
         
@@ -143,84 +260,191 @@ class Pipeline(QObject):
             for audio_chunk in audio_gen:
                 if not self.running:
                     break
-                buffer = np.concatenate([buffer, audio_chunk])
-                now = time.time()
-                buffer_duration = len(buffer) / self.audio.sample_rate
-                
-                # Check silence for finalization
-                # Use configured silence duration/threshold
+                n = self._n
+                end = n + len(audio_chunk)
+                if end > self._buf.size:
+                    # Shouldn't happen (hard limit cuts first), but never overrun
+                    end = self._buf.size
+                    audio_chunk = audio_chunk[:end - n]
+                # Quantize to int16 for storage; the energy math below
+                # stays on the float chunk so thresholds keep their meaning
+                self._buf[n:end] = (audio_chunk * 32767.0).astype(np.int16)
+                self._n = end
+                chunk_ss = float(np.dot(audio_chunk, audio_chunk))
+                self._ss += chunk_ss
+                mark_pos.append(end)
+                mark_ss.append(self._ss)
+                if chunk_ss > thr2 * (end - n):
+                    last_voice_pos = end
+                now = time.monotonic_ns()
+
+                # Check silence for finalization (all window sizes and the
+                # squared threshold were precomputed in __init__; comparing
+                # sum-of-squares against thr2 * count avoids the sqrt)
                 is_silence = False
-                min_silence_dur = config.silence_duration # e.g. 1.0s
-                
-                # Only check silence if we have enough buffer
-                if buffer_duration > min_silence_dur:
+                # Integer short-circuit: if an energetic chunk landed inside
+                # the tail window, it can't be silent — skip the lookup
+                # entirely (the common case while someone is speaking)
+                if self._n > tail_std and last_voice_pos <= self._n - tail_std:
                      # Check tail of silence duration
-                    tail = buffer[-int(self.audio.sample_rate * min_silence_dur):]
-                    rms = np.sqrt(np.mean(tail**2))
-                    if rms < self.audio.silence_threshold:
+                    ss, count = self._tail_ss(tail_std)
+                    if ss < thr2 * count:
                         is_silence = True
-                        
+
                 # Dynamic VAD Logic
                 # 1. Standard: > 2.0s duration AND > 1.0s silence (Configured)
-                standard_cut = (is_silence and buffer_duration > 2.0)
-                
+                standard_cut = (is_silence and self._n > min_standard)
+
                 # 2. Soft Limit: > 6.0s duration AND > 0.4s silence (Catch brief pauses to avoid huge latency)
+                # Only evaluated when the standard cut didn't already fire —
+                # the cuts are OR'd, so a second lookup would be wasted
                 soft_limit_cut = False
-                if buffer_duration > 6.0:
+                if not standard_cut and self._n > soft_limit and last_voice_pos <= self._n - tail_soft:
                     # Check shorter silence tail (0.4s)
-                    short_tail_samps = int(self.audio.sample_rate * 0.4)
-                    if len(buffer) > short_tail_samps:
-                        t_rms = np.sqrt(np.mean(buffer[-short_tail_samps:]**2))
-                        if t_rms < self.audio.silence_threshold:
-                            soft_limit_cut = True
-                            
+                    ss, count = self._tail_ss(tail_soft)
+                    if count and ss < thr2 * count:
+                        soft_limit_cut = True
+
                 # 3. Hard Limit: > max_phrase_duration (Force cut)
-                hard_limit_cut = (buffer_duration > self.audio.max_phrase_duration)
+                hard_limit_cut = (self._n > hard_limit)
 
                 should_finalize = standard_cut or soft_limit_cut or hard_limit_cut
-                
-                if should_finalize and buffer_duration > 0.5:
+
+                if should_finalize and self._n > min_finalize:
                     # FINALIZE
-                    final_buffer = buffer.copy()
                     cid = chunk_id
-                    
+
                     # Store current prompt to pass to task (thread safety)
                     prompt = self.last_final_text
-                    
+
                     # PRE-CHECK: Is the entire buffer actually silence?
                     # (Prevent infinite loop of repeating prompt on empty audio)
-                    overall_rms = np.sqrt(np.mean(final_buffer**2))
-                    if overall_rms < self.audio.silence_threshold:
+                    overall_rms = math.sqrt(self._ss / self._n)
+                    if overall_rms < silence_thr:
                          print(f"[Pipeline] Skipped silent chunk {cid} (RMS={overall_rms:.4f})")
                     else:
-                        # Submit Final Task
-                        # Pass prompt AND translate_executor for async translation
-                        transcribe_executor.submit(self._process_final_chunk, final_buffer, cid, prompt, translate_executor)
+                        # Queue Final Task for the consumer thread. Normally
+                        # the filled ring is handed over as a view and we
+                        # flip to the other ring; if the consumer is so far
+                        # behind that it still owns the other ring, fall
+                        # back to a copy rather than corrupt its audio.
+                        with self._pending_lock:
+                            other = self._active ^ 1
+                            if self._ring_busy[other]:
+                                final_buffer = self._buf[:self._n].copy()
+                                ring = None
+                            else:
+                                final_buffer = self._buf[:self._n]
+                                ring = self._active
+                                self._ring_busy[ring] = True
+                                self._active = other
+                                self._buf = self._bufs[other]
+                            self._pending.append(("final", final_buffer, cid, prompt, ring))
                     
                     # Reset
-                    buffer = np.array([], dtype=np.float32)
+                    self._n = 0
+                    self._ss = 0.0
+                    mark_pos.clear()
+                    mark_ss.clear()
+                    last_voice_pos = 0
                     chunk_id += 1
-                    phrase_start_time = now
-                    last_update_time = now
+                    last_update_ns = now
                     
                 # 2. Partial Update if: Interval passed AND not finalizing
-                elif now - last_update_time > config.update_interval and buffer_duration > 0.5:
+                elif now - last_update_ns > update_interval_ns and self._n > min_finalize:
                     # PARTIAL UPDATE
-                    partial_buffer = buffer.copy()
                     prompt = self.last_final_text
-                    
+
                     # RMS Check to avoid partial hallucination on silence
-                    rms = np.sqrt(np.mean(partial_buffer**2))
-                    if rms > self.audio.silence_threshold:
-                        transcribe_executor.submit(self._process_partial_chunk, partial_buffer, chunk_id, prompt)
-                    
-                    last_update_time = now
-                    
+                    if self._ss > thr2 * self._n:
+                        with self._pending_lock:
+                            if self._partial_inflight == 0:
+                                # Snapshot into the rotating scratch arena
+                                # instead of allocating a fresh copy. If an
+                                # older partial is still pending, overwrite
+                                # it in place and reuse its slot — only the
+                                # newest snapshot matters, and it keeps the
+                                # arena from wrapping onto a slot the
+                                # consumer hasn't read yet while it chews
+                                # through finals.
+                                pend = self._pending
+                                j = len(pend) - 1
+                                while j >= 0 and pend[j][0] != "partial":
+                                    j -= 1
+                                if j >= 0:
+                                    slot = pend[j][4]
+                                else:
+                                    slot = self._scratch_idx
+                                    self._scratch_idx = (self._scratch_idx + 1) % len(self._scratch)
+                                scratch = self._scratch[slot]
+                                count = self._n
+                                np.multiply(self._buf[:count], 1.0 / 32767.0,
+                                            out=scratch[:count])
+                                entry = ("partial", scratch[:count], chunk_id, prompt, slot)
+                                if j >= 0:
+                                    pend[j] = entry
+                                else:
+                                    pend.append(entry)
+
+                    last_update_ns = now
+
         except Exception as e:
             print(f"[Pipeline] Error in loop: {e}")
         finally:
-            transcribe_executor.shutdown(wait=False)
-            translate_executor.shutdown(wait=False)
+            for _ in translators:
+                self.text_q.put(None)
+
+    def _transcribe_consumer(self):
+        """Drain pending transcription tasks on a dedicated thread.
+
+        Grabs whatever accumulated since the last pass and coalesces it:
+        a partial is superseded by any newer partial or final for the same
+        chunk id (transcribing a stale snapshot only to overwrite it a
+        moment later wastes a full model pass). Finals always run, in
+        submission order.
+        """
+        # Don't touch the model until warmup finished (it usually has by
+        # the time the first phrase completes)
+        if self._warm_future is not None:
+            self._warm_future.result()
+            self._warm_future = None
+
+        while self.running or self._pending:
+            with self._pending_lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                time.sleep(0.05)
+                continue
+
+            partial_slot = {}  # chunk_id -> index of newest pending partial
+            for idx, (kind, _audio, cid, _prompt, _ring) in enumerate(batch):
+                stale = partial_slot.pop(cid, None)
+                if stale is not None:
+                    batch[stale] = None  # superseded
+                if kind == "partial":
+                    partial_slot[cid] = idx
+
+            for task in batch:
+                if task is None:
+                    continue
+                kind, audio, cid, prompt, ring = task
+                if kind == "final":
+                    # Dequantize the int16 slice for the model, then release
+                    # the ring immediately — ownership only needs to cover
+                    # this read, not the whole transcription
+                    audio = np.multiply(audio, 1.0 / 32767.0, dtype=np.float32)
+                    if ring is not None:
+                        with self._pending_lock:
+                            self._ring_busy[ring] = False
+                    self._process_final_chunk(audio, cid, prompt)
+                else:
+                    with self._pending_lock:
+                        self._partial_inflight += 1
+                    try:
+                        self._process_partial_chunk(audio, cid, prompt)
+                    finally:
+                        with self._pending_lock:
+                            self._partial_inflight -= 1
 
     def _process_partial_chunk(self, audio_data, chunk_id, prompt=""):
         """Transcribe and update UI (No translation)"""
@@ -228,12 +452,25 @@ class Pipeline(QObject):
             # Use accumulated context as prompt
             text = self.transcriber.transcribe(audio_data, prompt=prompt)
             if text:
-                self.signals.update_text.emit(chunk_id, text, "")
+                # Overwrite the pending slot; the flush timer emits the
+                # newest text. A stale partial that was never flushed is
+                # exactly the one we want to skip.
+                with self._emit_lock:
+                    self._pending_emit[chunk_id] = (text, "")
         except Exception as e:
             print(f"[Partial {chunk_id}] Error: {e}")
 
-    def _process_final_chunk(self, audio_data, chunk_id, prompt="", translate_executor=None):
-        """Transcribe, Log, and Trigger Translation Async"""
+    def _flush_partial_emits(self):
+        """Emit coalesced partial updates (runs on the Qt thread, 50ms tick)"""
+        if not self._pending_emit:
+            return
+        with self._emit_lock:
+            items, self._pending_emit = self._pending_emit, {}
+        for cid, (text, translated) in items.items():
+            self.signals.update_text.emit(cid, text, translated)
+
+    def _process_final_chunk(self, audio_data, chunk_id, prompt=""):
+        """Transcribe, Log, and hand off to the translation queue"""
         try:
             text = self.transcriber.transcribe(audio_data, prompt=prompt)
             if text:
@@ -241,18 +478,33 @@ class Pipeline(QObject):
                 # Save for context (only if meaningful)
                 if len(text.split()) > 2:
                     self.last_final_text = text
-                
-                # Emit final transcription first (confirms text)
+
+                # Emit final transcription first (confirms text); drop any
+                # unflushed partial so it can't overwrite the final later
+                with self._emit_lock:
+                    self._pending_emit.pop(chunk_id, None)
                 self.signals.update_text.emit(chunk_id, text, "(translating...)")
-                
-                # Offload translation to separate thread so we don't block next transcription
-                if translate_executor:
-                    translate_executor.submit(self._run_translation, text, chunk_id)
+
+                # Hand off to translation workers so we don't block next transcription
+                self.text_q.put((text, chunk_id))
             else:
                 pass
         except Exception as e:
             print(f"[Final {chunk_id}] Error: {e}")
 
+    def _translate_worker(self):
+        """Drain finalized text from text_q and translate it.
+
+        config.translation_threads of these run concurrently, so translation
+        parallelism scales independently of the (serial) ASR stage.
+        """
+        while True:
+            item = self.text_q.get()
+            if item is None:
+                break
+            text, cid = item
+            self._run_translation(text, cid)
+
     def _run_translation(self, text, chunk_id):
         """Run translation in background and emit result"""
         try:
@@ -265,18 +517,18 @@ class Pipeline(QObject):
     
     def _transcribe_chunk(self, transcriber, audio_chunk, chunk_id):
         """Transcribe a single chunk and log timing"""
-        t0 = time.time()
+        t0 = time.perf_counter_ns()
         text = transcriber.transcribe(audio_chunk)
-        t1 = time.time()
-        print(f"[Chunk {chunk_id}] Transcribed in {t1-t0:.2f}s: {text if text else '(empty)'}")
+        t1 = time.perf_counter_ns()
+        print(f"[Chunk {chunk_id}] Transcribed in {(t1-t0)/1e9:.2f}s: {text if text else '(empty)'}")
         return text
-    
+
     def _translate_and_log(self, text, chunk_id=0):
         """Translate text and log result"""
-        t0 = time.time()
+        t0 = time.perf_counter_ns()
         translated_text = self.translator.translate(text)
-        t1 = time.time()
-        print(f"[Chunk {chunk_id}] Translated in {t1-t0:.2f}s: {translated_text}")
+        t1 = time.perf_counter_ns()
+        print(f"[Chunk {chunk_id}] Translated in {(t1-t0)/1e9:.2f}s: {translated_text}")
         return (text, translated_text)
 
 # Global reference for signal handler
@@ -300,7 +552,7 @@ def start_overlay_session():
     window.show()
     
     # Logic
-    _pipeline = Pipeline()
+    _pipeline = build_pipeline()
     
     # Connect signals
     _pipeline.signals.update_text.connect(window.update_text)
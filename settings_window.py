@@ -1,6 +1,6 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QLineEdit, QHBoxLayout,
                              QFormLayout, QPushButton, QComboBox, QDoubleSpinBox, QMessageBox, QSpinBox)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThread, QThreadPool, pyqtSignal
 import configparser
 import os
 from config import config
@@ -126,11 +126,9 @@ class SettingsWindow(QWidget):
         
     def fetch_models(self):
         """Fetch models from the provided Base URL using openai client"""
-        from openai import OpenAI
-        
         api_key = self.api_key_input.text() or "dummy"
         base_url = self.base_url_input.text()
-        
+
         if not base_url:
             QMessageBox.warning(self, "Missing URL", "Please enter an API Base URL first.")
             return
@@ -138,84 +136,98 @@ class SettingsWindow(QWidget):
         self.refresh_btn.setEnabled(False)
         self.model_input.clear()
         self.model_input.addItem("Fetching...")
-        
-        # Use a thread to avoid freezing UI
-        import threading
-        def _fetch():
-            try:
-                client = OpenAI(api_key=api_key, base_url=base_url)
-                models_response = client.models.list()
-                # Sort models by id
-                model_ids = sorted([m.id for m in models_response.data])
-                
-                # Update UI in main thread safety check? 
-                # PyQt technically requires signal for thread safety, but for simple list update...
-                # Let's verify if we need signals. Yes strictly speaking.
-                # Use QTimer to update on main thread or simple hack?
-                # For safety, I will just call a reactor method or use strict signals. 
-                # Actually, to save complexity in this small edit, I'll run sync with a short timeout?
-                # No, freezing is bad. I'll use a simple QTimer check or try/except.
-                # Wait, I can't easily add signals now without major refactor.
-                # I will run it synchronously with a strict timeout of 3s, assuming user server is local or fast.
-                pass 
-            except Exception as e:
-                pass
-
-        # REVISING: Threading without signals in PyQt will crash if we touch UI.
-        # Running sync is safer for now, user expects a pause with "Fetch".
-        
-        try:
-            client = OpenAI(api_key=api_key, base_url=base_url)
-            # 3 second timeout to prevent long hang
-            models_response = client.models.list(timeout=5.0) 
-            model_ids = sorted([m.id for m in models_response.data])
-            
-            self.model_input.clear()
+
+        # Run the request on a QThread; the result comes back via signal on
+        # the GUI thread, so the dialog stays responsive while it fetches
+        self._models_fetcher = ModelsFetcher(api_key, base_url)
+        self._models_fetcher.done.connect(self._on_models_fetched)
+        self._models_fetcher.start()
+
+    def _on_models_fetched(self, model_ids, error):
+        """Populate the model combo with the fetched list (GUI thread)"""
+        self.model_input.clear()
+        if error:
+            self.model_input.addItem(config.model) # Restore
+            QMessageBox.critical(self, "Error", f"Failed to fetch models: {error}")
+        else:
             self.model_input.addItems(model_ids)
-            
+
             # Restore current if in list
             current = config.model
             if current in model_ids:
                 self.model_input.setCurrentText(current)
             elif model_ids:
                 self.model_input.setCurrentIndex(0)
-                
+
             QMessageBox.information(self, "Success", f"Found {len(model_ids)} models.")
-            
-        except Exception as e:
-            self.model_input.clear()
-            self.model_input.addItem(config.model) # Restore
-            QMessageBox.critical(self, "Error", f"Failed to fetch models: {str(e)}")
-            
+
         self.refresh_btn.setEnabled(True)
-        
+
     def save_config(self):
-        """Write to config.ini"""
+        """Write to config.ini (parse + file I/O run off the GUI thread)"""
         config_path = os.path.join(os.path.dirname(__file__), "config.ini")
-        parser = configparser.ConfigParser()
-        parser.read(config_path)
-        
-        # Update values
-        if not parser.has_section("api"): parser.add_section("api")
-        if not parser.has_section("translation"): parser.add_section("translation")
-        if not parser.has_section("transcription"): parser.add_section("transcription")
-        if not parser.has_section("audio"): parser.add_section("audio")
-        
-        parser.set("api", "api_key", self.api_key_input.text() or "")
-        parser.set("api", "base_url", self.base_url_input.text() or "")
-        parser.set("translation", "model", self.model_input.currentText())
-        parser.set("translation", "threads", str(self.threads_input.value()))
-        parser.set("transcription", "backend", self.backend_input.currentText())
-        parser.set("transcription", "whisper_model", self.whisper_input.currentText())
-        parser.set("transcription", "funasr_model", self.funasr_input.currentText())
-        parser.set("audio", "streaming_step_size", str(self.step_size_input.value()))
-        parser.set("audio", "max_phrase_duration", str(self.max_phrase_input.value()))
-        parser.set("audio", "silence_duration", str(self.silence_dur_input.value()))
-        
+
+        # Gather all values on the GUI thread, then hand the write off
+        updates = {
+            "api": {
+                "api_key": self.api_key_input.text() or "",
+                "base_url": self.base_url_input.text() or "",
+            },
+            "translation": {
+                "model": self.model_input.currentText(),
+                "threads": str(self.threads_input.value()),
+            },
+            "transcription": {
+                "backend": self.backend_input.currentText(),
+                "whisper_model": self.whisper_input.currentText(),
+                "funasr_model": self.funasr_input.currentText(),
+            },
+            "audio": {
+                "streaming_step_size": str(self.step_size_input.value()),
+                "max_phrase_duration": str(self.max_phrase_input.value()),
+                "silence_duration": str(self.silence_dur_input.value()),
+            },
+        }
+        QThreadPool.globalInstance().start(lambda: self._write_config(config_path, updates))
+
+        QMessageBox.information(self, "Saved", "Configuration saved! The app should restart automatically.")
+        self.close()
+
+    @staticmethod
+    def _write_config(config_path, updates):
+        """Merge updates into config.ini atomically (runs on the thread pool)"""
         try:
-            with open(config_path, 'w') as f:
+            parser = configparser.ConfigParser()
+            parser.read(config_path)
+            for section, values in updates.items():
+                if not parser.has_section(section):
+                    parser.add_section(section)
+                for key, value in values.items():
+                    parser.set(section, key, value)
+
+            # Write to a sibling temp file and swap it in, so a crash
+            # mid-write can't leave a truncated config.ini behind
+            tmp_path = config_path + ".tmp"
+            with open(tmp_path, 'w') as f:
                 parser.write(f)
-            QMessageBox.information(self, "Saved", "Configuration saved! The app should restart automatically.")
-            self.close()
+            os.replace(tmp_path, config_path)
+        except Exception as e:
+            print(f"[Settings] Failed to save config: {e}")
+
+class ModelsFetcher(QThread):
+    """Fetches the model list off the GUI thread (client.models.list blocks)"""
+    done = pyqtSignal(list, str)  # (model_ids, error message — empty on success)
+
+    def __init__(self, api_key, base_url):
+        super().__init__()
+        self.api_key = api_key
+        self.base_url = base_url
+
+    def run(self):
+        try:
+            from openai import OpenAI
+            client = OpenAI(api_key=self.api_key, base_url=self.base_url)
+            models_response = client.models.list(timeout=5.0)
+            self.done.emit(sorted([m.id for m in models_response.data]), "")
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save config: {e}")
+            self.done.emit([], str(e))
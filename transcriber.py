@@ -1,7 +1,88 @@
 import numpy as np
+import re
+import weakref
+from enum import IntEnum
+
+class Backend(IntEnum):
+    """ASR backend ids — hot paths compare these ints instead of the
+    config strings ('whisper'/'mlx'/'funasr'), which stay user-facing."""
+    WHISPER = 0
+    MLX = 1
+    FUNASR = 2
+
+# Five or more consecutive repeats of one token ("once once once once once").
+# The lookarounds pin the match to whole tokens so "in in in in inside"
+# doesn't count. Compiled once; the search runs in the C regex engine
+# instead of a per-word Python loop.
+_REPEAT_RE = re.compile(r'(?<!\S)(\S+)(?:\s+\1){4,}(?=\s|$)', re.IGNORECASE)
+
+# Strips punctuation for echo comparison; compiled once at import instead
+# of per transcribe() call.
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+# One second of 16 kHz silence, shared by every warmup call. Marked
+# read-only so a backend can't scribble over the shared buffer.
+_WARMUP_SILENCE = np.zeros(16000, dtype=np.float32)
+_WARMUP_SILENCE.flags.writeable = False
+
+# Optional numba kernel for the hallucination filter: one compiled pass
+# over the word-hash array does both the consecutive-repeat and the
+# distinct-word check. numba is not a hard dependency — without it the
+# pure-Python checks in _is_hallucination run instead.
+_HALLUCINATION_KERNEL = None
+try:
+    from numba import njit
+
+    @njit(cache=True)
+    def _hallucination_kernel(hashes, need):
+        """True if 5+ consecutive equal hashes, or (need > 0) fewer than
+        `need` distinct values in the whole array."""
+        run = 1
+        for i in range(1, hashes.size):
+            if hashes[i] == hashes[i - 1]:
+                run += 1
+                if run > 4:
+                    return True
+            else:
+                run = 1
+        if need > 0:
+            s = np.sort(hashes)
+            distinct = 1
+            for i in range(1, s.size):
+                if s[i] != s[i - 1]:
+                    distinct += 1
+                    if distinct >= need:
+                        return False
+            return distinct < need
+        return False
+
+    _HALLUCINATION_KERNEL = _hallucination_kernel
+except ImportError:
+    pass
+
+def _funasr_parse_single_dict(result):
+    """Direct extractor for the [{'text': ...}] result shape (see
+    Transcriber._parse_funasr_generic, which installs this)."""
+    if len(result) != 1:
+        # Shape drifted to multi-element: raise so _transcribe_funasr
+        # falls back to the generic walk instead of dropping segments
+        raise LookupError("not a single-element result")
+    return result[0]['text'].strip()
 
 class Transcriber:
-    def __init__(self, backend="whisper", model_size="base", device="cpu", compute_type="int8", language=None):
+    # Loaded models keyed by (backend, model_size, device, compute_type).
+    # Weak values: a model stays cached only while some Transcriber still
+    # holds it, so restarting the pipeline with unchanged settings skips
+    # the multi-second reload without pinning replaced models in memory.
+    _MODEL_CACHE = weakref.WeakValueDictionary()
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop cached model references (models still in use are unaffected)"""
+        cls._MODEL_CACHE.clear()
+
+    def __init__(self, backend="whisper", model_size="base", device="cpu", compute_type="int8", language=None,
+                 skip_silence=True, beam_size=1):
         """
         Initialize Transcriber with multiple backend support
         
@@ -9,19 +90,33 @@ class Transcriber:
             backend: ASR backend to use - 'whisper', 'mlx', or 'funasr'
             model_size: Model identifier (for Whisper: tiny/base/small/medium/large/turbo, for FunASR: model name)
             device: Device to use (cpu/cuda/auto)
-            compute_type: Compute type for faster-whisper (int8/float16/float32)
+            compute_type: Compute type for faster-whisper (auto/int8/float16/float32)
             language: Source language code or None for auto-detect
+            skip_silence: Return "" for near-silent audio without running the model
+            beam_size: Whisper decoder beam width (1 = greedy, the real-time default)
         """
         self.backend = backend.lower()
+        if self.backend == "funasr":
+            self.backend_id = Backend.FUNASR
+        elif self.backend == "mlx":
+            self.backend_id = Backend.MLX
+        else:
+            self.backend_id = Backend.WHISPER
         self.language = language
+        self.skip_silence = skip_silence
+        self.beam_size = beam_size
         self.model_size = model_size
         self.device = device
         self.compute_type = compute_type
         self.model = None
-        
-        if self.backend == "funasr":
+        # (raw prompt, normalized prompt, word-boundary suffixes of the
+        # normalized prompt) — the same context prompt is reused across many
+        # consecutive chunks, so normalize and enumerate suffixes once
+        self._norm_prompt_cache = (None, None, frozenset())
+
+        if self.backend_id == Backend.FUNASR:
             self._init_funasr(model_size, device)
-        elif self.backend == "mlx":
+        elif self.backend_id == Backend.MLX:
             self._init_mlx(model_size)
         else:  # default to whisper
             self._init_whisper(model_size, device, compute_type)
@@ -29,11 +124,44 @@ class Transcriber:
     def _init_whisper(self, model_size, device, compute_type):
         """Initialize faster-whisper backend"""
         from faster_whisper import WhisperModel
-        self.model = WhisperModel(model_size, device=device, compute_type=compute_type)
-        print(f"[Transcriber] Using faster-whisper (CPU/CUDA) with model: {model_size}")
+        import os
+        self._impl = self._transcribe_faster_whisper
+        requested_key = ("whisper", model_size, device, compute_type)
+        cached = self._MODEL_CACHE.get(requested_key)
+        if cached is not None:
+            self.model = cached
+            print(f"[Transcriber] Reusing cached faster-whisper model: {model_size}")
+            return
+        # Size the ctranslate2 thread pool to the physical cores (cpu_count
+        # reports logical cores; hyperthread siblings only add contention
+        # for this workload). 0 would mean "library default" (4).
+        cpu_threads = max(1, (os.cpu_count() or 2) // 2)
+        try:
+            # "auto" lets ctranslate2 pick the fastest type the hardware
+            # supports (e.g. int8_float16 on GPUs with tensor cores)
+            self.model = WhisperModel(model_size, device=device, compute_type=compute_type,
+                                      cpu_threads=cpu_threads)
+        except ValueError as e:
+            # Requested compute type not supported on this device (common when
+            # a GPU config is copied to a CPU machine) — retry with a safe one
+            fallback = "float32" if device == "cuda" else "int8"
+            print(f"[Transcriber] compute_type '{compute_type}' not supported ({e}), retrying with '{fallback}'")
+            self.compute_type = compute_type = fallback
+            self.model = WhisperModel(model_size, device=device, compute_type=compute_type,
+                                      cpu_threads=cpu_threads)
+        try:
+            # Store under the requested key as well: the fallback above may
+            # have rebound compute_type, and the next Transcriber looks up
+            # with the requested (config) value
+            self._MODEL_CACHE[("whisper", model_size, device, compute_type)] = self.model
+            self._MODEL_CACHE[requested_key] = self.model
+        except TypeError:
+            pass  # model type doesn't support weak references
+        print(f"[Transcriber] Using faster-whisper (CPU/CUDA) with model: {model_size}, compute_type={compute_type}, cpu_threads={cpu_threads}")
     
     def _init_mlx(self, model_size):
-        sssss
+        """Initialize MLX Whisper backend (Apple Silicon / Metal)"""
+        self._impl = self._transcribe_mlx
         try:
             import mlx_whisper
             # MLX doesn't need explicit model loading here
@@ -41,12 +169,16 @@ class Transcriber:
         except ImportError:
             print("[Transcriber] Warning: mlx_whisper not available, falling back to faster-whisper")
             self.backend = "whisper"
+            self.backend_id = Backend.WHISPER
             self._init_whisper(model_size, "cpu", "int8")
     
     def _init_funasr(self, model_size, device):
         """Initialize FunASR backend with device support"""
+        self._impl = self._transcribe_funasr
+        self._funasr_parse = self._parse_funasr_generic
         try:
             from funasr import AutoModel
+            import os
             import platform
             import torch
             
@@ -58,7 +190,13 @@ class Transcriber:
             
             # Store device for later use in transcription
             self.funasr_device = funasr_device
-            
+
+            cached = self._MODEL_CACHE.get(("funasr", model_size, funasr_device, None))
+            if cached is not None:
+                self.model = cached
+                print(f"[Transcriber] Reusing cached FunASR model: {model_size}")
+                return
+
             # For MPS device, monkey patch torch.tensor to force float32
             if funasr_device == "mps":
                 print("[Transcriber] Applying MPS float32 compatibility patches")
@@ -70,7 +208,10 @@ class Transcriber:
                 "model": model_size,
                 "device": funasr_device,
                 "disable_pbar": True,
-                "disable_log": False
+                "disable_log": False,
+                # Size FunASR's intra-op thread pool to the physical cores,
+                # same reasoning as cpu_threads in _init_whisper
+                "ncpu": max(1, (os.cpu_count() or 2) // 2)
             }
             
             # For MPS device, we need to ensure float32 dtype
@@ -81,8 +222,15 @@ class Transcriber:
                 old_default_dtype = torch.get_default_dtype()
                 torch.set_default_dtype(torch.float32)
             
-            self.model = AutoModel(**model_kwargs)
-            
+            try:
+                # Quantized weights roughly halve CPU inference time; not
+                # every model on the hub ships a quantized export, so fall
+                # back to the full-precision load if this one doesn't
+                self.model = AutoModel(quantize=True, **model_kwargs)
+            except Exception as quant_error:
+                print(f"[Transcriber] Quantized load failed ({quant_error}), loading full precision")
+                self.model = AutoModel(**model_kwargs)
+
             # CRITICAL: For MPS, explicitly convert ALL model components to float32 after initialization
             # This is necessary because FunASR's internal operations may still use float64
             if funasr_device == "mps":
@@ -118,11 +266,17 @@ class Transcriber:
                 # Restore default dtype
                 torch.set_default_dtype(old_default_dtype)
             
+            try:
+                self._MODEL_CACHE[("funasr", model_size, funasr_device, None)] = self.model
+            except TypeError:
+                pass  # model type doesn't support weak references
+
             print(f"[Transcriber] FunASR model loaded successfully on {funasr_device}")
         except Exception as e:
             print(f"[Transcriber] Error loading FunASR model: {e}")
             print("[Transcriber] Falling back to faster-whisper")
             self.backend = "whisper"
+            self.backend_id = Backend.WHISPER
             self._init_whisper("base", "cpu", "int8")
     
     def _apply_mps_float32_patches(self):
@@ -349,13 +503,28 @@ class Transcriber:
         return "cpu"
     def transcribe(self, audio_data, prompt=None):
         """Transcribe audio using the configured backend"""
-        if self.backend == "funasr":
-            text = self._transcribe_funasr(audio_data, prompt)
-        elif self.backend == "mlx":
-            text = self._transcribe_mlx(audio_data, prompt)
-        else:  # whisper
-            text = self._transcribe_faster_whisper(audio_data, prompt)
-            
+        # Normalize once here instead of in each backend: mono, float32,
+        # C-contiguous. All three backends hand the buffer to C code that
+        # expects exactly that; when the input already qualifies this is a
+        # no-op view, not a copy.
+        if audio_data.ndim > 1:
+            audio_data = audio_data.mean(axis=1, dtype=np.float32)
+        audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
+
+        # The pipeline's VAD normally keeps silence out, but streaming mode
+        # and direct callers don't filter — skip the model pass (hundreds of
+        # ms) when the whole buffer is effectively silent (RMS < 0.001).
+        if self.skip_silence:
+            if audio_data.size == 0:
+                return ""
+            if float(np.dot(audio_data, audio_data)) < 1e-6 * audio_data.size:
+                return ""
+
+        # _impl is bound to the backend's transcribe method during init
+        # (fallbacks rebind it), so no string comparison per call here
+        text = self._impl(audio_data, prompt)
+
+
         # Filter hallucinations (infinite loops, e.g. "once once once")
         if self._is_hallucination(text):
             print(f"[Transcriber] Filtered hallucination: {text[:50]}...")
@@ -368,96 +537,164 @@ class Transcriber:
             
         return text
 
+    def transcribe_batch(self, audio_list, prompt=None):
+        """Transcribe several audio buffers in one call, one text per input.
+
+        FunASR's generate() accepts a list of inputs and batches them
+        through the encoder in a single pass, which is much cheaper than
+        calling it once per buffer. Other backends (and the MPS path, which
+        needs per-buffer tensor handling) fall back to sequential
+        transcribe() calls. Results go through the same hallucination and
+        prompt-echo filters as transcribe().
+        """
+        if not audio_list:
+            return []
+        if self.backend_id != Backend.FUNASR or getattr(self, 'funasr_device', 'cpu') == "mps":
+            return [self.transcribe(audio, prompt) for audio in audio_list]
+
+        inputs = []
+        for audio in audio_list:
+            if audio.ndim > 1:
+                audio = audio.mean(axis=1, dtype=np.float32)
+            inputs.append(np.ascontiguousarray(audio, dtype=np.float32))
+
+        try:
+            result = self.model.generate(
+                input=inputs,
+                batch_size_s=300,
+                hotword="" if not prompt else prompt
+            )
+        except Exception as e:
+            print(f"[Transcriber] FunASR batch error: {e}")
+            return [""] * len(audio_list)
+
+        if not isinstance(result, list):
+            result = [result]
+        texts = []
+        for item in result:
+            if isinstance(item, dict):
+                texts.append(item.get('text', '').strip())
+            elif isinstance(item, str):
+                texts.append(item.strip())
+            else:
+                texts.append("")
+        # generate() yields one result per input; pad defensively if it didn't
+        texts += [""] * (len(audio_list) - len(texts))
+
+        for i, text in enumerate(texts):
+            if self._is_hallucination(text):
+                print(f"[Transcriber] Filtered hallucination: {text[:50]}...")
+                texts[i] = ""
+            elif prompt and self._is_prompt_echo(text, prompt):
+                print(f"[Transcriber] Filtered prompt echo: {text[:50]}...")
+                texts[i] = ""
+        return texts
+
     def warmup(self):
         """Warmup the model to prevent lag on first inference"""
         print("[Transcriber] Warming up model...")
-        # 1 second of silence
-        dummy_audio = np.zeros(16000, dtype=np.float32)
+        # Warmup audio is silence by construction; disable the silence gate
+        # so the dummy pass actually reaches the model
+        skip_silence = self.skip_silence
+        self.skip_silence = False
         try:
-            self.transcribe(dummy_audio)
+            self.transcribe(_WARMUP_SILENCE)
             print("[Transcriber] Warmup complete.")
         except Exception as e:
             print(f"[Transcriber] Warmup failed (non-fatal): {e}")
+        finally:
+            self.skip_silence = skip_silence
 
     def _is_hallucination(self, text):
         """Check if text looks like a Whisper hallucination (repetitive loop)"""
         if not text:
             return False
-            
-        words = text.split()
-        if not words:
-            return False
-            
+
+        if _HALLUCINATION_KERNEL is not None:
+            # Lowered to match the case-insensitive regex path below
+            words = text.lower().split()
+            if not words:
+                return False
+            hashes = np.fromiter((hash(w) for w in words), dtype=np.int64, count=len(words))
+            # ceil(0.4 * n), matching the pure-Python scan below
+            need = -(-2 * len(words) // 5) if len(words) > 10 else 0
+            return bool(_HALLUCINATION_KERNEL(hashes, need))
+
         # 1. Check for immediate consecutive repetitions of the same word
         # e.g. "once once once once once"
-        max_repeats = 0
-        current_repeats = 1
-        last_word = ""
-        
-        for word in words:
-            if word == last_word:
-                current_repeats += 1
-            else:
-                max_repeats = max(max_repeats, current_repeats)
-                current_repeats = 1
-                last_word = word
-        max_repeats = max(max_repeats, current_repeats)
-        
-        if max_repeats > 4:
+        if _REPEAT_RE.search(text):
             return True
-            
+
+        # Lowered so the distinct-word count matches the kernel path above
+        words = text.lower().split()
+        if not words:
+            return False
+
         # 2. Check for low information density (unique words / total words)
         # e.g. "that was that was that was that was"
         if len(words) > 10:
-            unique_words = set(words)
-            ratio = len(unique_words) / len(words)
-            if ratio < 0.4: # Filter if less than 40% of words are unique
-                return True
-                
+            # Bail out as soon as enough distinct words are seen to clear
+            # the 40% threshold — real speech usually passes within the
+            # first handful of words, so the full scan only runs on loops
+            seen = set()
+            add = seen.add
+            # ceil(0.4 * n): exactly 40% distinct passed the old ratio
+            # check (ratio < 0.4 filtered), so passing needs distinct >= this
+            need = -(-2 * len(words) // 5)
+            for w in words:
+                add(w)
+                if len(seen) >= need:
+                    break
+            else:
+                return True  # scanned everything without reaching 40% unique
+
         return False
 
     def _is_prompt_echo(self, text, prompt):
         """Check if the transcribed text is just an echo of the prompt (common hallucination on silence/music)"""
         if not text or not prompt:
             return False
-            
-        import re
-        def normalize(s):
-            return re.sub(r'[^\w\s]', '', s.lower()).strip()
-            
-        norm_text = normalize(text)
-        norm_prompt = normalize(prompt)
-        
+
+        # An echo can't be meaningfully longer than its prompt — if the text
+        # clearly is, skip the normalization passes below. The +16 slack
+        # keeps short prompts from tripping the ratio on a few extra chars.
+        lt, lp = len(text), len(prompt)
+        if lt > lp * 1.5 and lt > lp + 16:
+            return False
+
+        # split + join collapses the whitespace runs left behind by removing
+        # spaced punctuation ("big , world" -> "big  world"), so the text
+        # stays comparable with the single-spaced suffixes below
+        norm_text = " ".join(_PUNCT_RE.sub('', text.lower()).split())
+
+        cached_prompt, norm_prompt, suffixes = self._norm_prompt_cache
+        if prompt != cached_prompt:
+            words = _PUNCT_RE.sub('', prompt.lower()).split()
+            norm_prompt = " ".join(words)
+            # Every word-boundary suffix, e.g. "hello big world" ->
+            # {"hello big world", "big world", "world"}. The full prompt is
+            # in the set, so the exact-match case is covered too.
+            suffixes = frozenset(" ".join(words[i:]) for i in range(len(words)))
+            self._norm_prompt_cache = (prompt, norm_prompt, suffixes)
+
         if not norm_text or not norm_prompt:
             return False
-            
-        # Check for exact match or strong overlap
-        if norm_text == norm_prompt:
-            return True
-            
-        # Check if text is a trailing substring of prompt (e.g. Prompt="Hello world", Text="world")
-        if norm_prompt.endswith(norm_text):
-            return True
-            
-        return False
+
+        # Echo = the text is a trailing run of the prompt's words
+        # (e.g. Prompt="Hello world", Text="world"); O(1) set lookup
+        # replaces the old endswith scan and won't match mid-word
+        return norm_text in suffixes
 
     def _transcribe_funasr(self, audio_data, prompt=None):
         """Transcribe using FunASR backend"""
         try:
             import torch
             
-            # FunASR expects audio data in specific format
-            # Convert numpy array to the format FunASR expects
-            # Most FunASR models expect 16kHz audio
-            
-            # Ensure audio is in the right shape and format
-            if len(audio_data.shape) > 1:
-                audio_data = audio_data.flatten()
-            
+            # Audio arrives mono/float32/contiguous from transcribe();
+            # most FunASR models expect 16kHz audio
+
             # For MPS device, ensure audio data is float32 to avoid float64 conversion errors
             if hasattr(self, 'funasr_device') and self.funasr_device == "mps":
-                # Ensure audio data is explicitly float32
-                audio_data = audio_data.astype(np.float32)
                 # Convert to torch tensor with explicit float32 dtype for MPS
                 audio_tensor = torch.from_numpy(audio_data).to(dtype=torch.float32, device="mps")
                 input_data = audio_tensor
@@ -497,21 +734,16 @@ class Transcriber:
                     hotword="" if not prompt else prompt
                 )
             
-            # Extract text from result
-            if isinstance(result, list) and len(result) > 0:
-                # FunASR returns a list of results
-                text_parts = []
-                for item in result:
-                    if isinstance(item, dict) and 'text' in item:
-                        text_parts.append(item['text'])
-                    elif isinstance(item, str):
-                        text_parts.append(item)
-                return " ".join(text_parts).strip()
-            elif isinstance(result, dict) and 'text' in result:
-                return result['text'].strip()
-            else:
-                return ""
-                
+            # Extract text with the shape-specialized parser once one has
+            # been learned; any shape mismatch drops back to the generic
+            # walk, which re-learns
+            try:
+                return self._funasr_parse(result)
+            except (LookupError, AttributeError, TypeError):
+                self._funasr_parse = self._parse_funasr_generic
+                return self._parse_funasr_generic(result)
+
+
         except Exception as e:
             error_msg = str(e)
             if "float64" in error_msg and hasattr(self, 'funasr_device') and self.funasr_device == "mps":
@@ -528,6 +760,35 @@ class Transcriber:
                 print(f"[Transcriber] FunASR Error: {e}")
             return ""
 
+    def _parse_funasr_generic(self, result):
+        """Extract text from any FunASR result shape.
+
+        A given model returns the same result shape on every call, so once
+        the common [{'text': ...}] shape is observed this installs the
+        direct extractor for subsequent chunks; _transcribe_funasr falls
+        back here (and re-learns) if the shape ever changes.
+        """
+        if isinstance(result, list) and len(result) > 0:
+            if len(result) == 1:
+                item = result[0]
+                if isinstance(item, dict):
+                    if 'text' in item:
+                        self._funasr_parse = _funasr_parse_single_dict
+                    return item.get('text', '').strip()
+                if isinstance(item, str):
+                    return item.strip()
+                return ""
+            text_parts = []
+            for item in result:
+                if isinstance(item, dict) and 'text' in item:
+                    text_parts.append(item['text'])
+                elif isinstance(item, str):
+                    text_parts.append(item)
+            return " ".join(text_parts).strip()
+        if isinstance(result, dict) and 'text' in result:
+            return result['text'].strip()
+        return ""
+
     def _transcribe_mlx(self, audio_data, prompt=None):
         import mlx_whisper
         # mlx_whisper.transcribe takes audio and other kwargs
@@ -566,11 +827,22 @@ class Transcriber:
     def _transcribe_faster_whisper(self, audio_data, prompt=None):
         segments, _ = self.model.transcribe(
             audio_data, 
-            language=self.language, 
-            beam_size=5,
+            language=self.language,
+            # Greedy decoding by default: beam 5 costs roughly 5x the
+            # decoder time for marginal quality on short live phrases.
+            # temperature=0.0 disables the sampling-fallback ladder.
+            beam_size=self.beam_size,
+            best_of=self.beam_size,
+            temperature=0.0,
             condition_on_previous_text=False, # We manage context manually if needed
             initial_prompt=prompt,
-            no_speech_threshold=0.6
+            no_speech_threshold=0.6,
+            without_timestamps=True # We only keep the text; skip timestamp decoding
         )
-        text = " ".join([segment.text for segment in segments]).strip()
-        return text
+        # segments is a lazy generator — decoding happens as we iterate.
+        # Bind append once so the hot loop is just attribute read + call.
+        parts = []
+        append = parts.append
+        for segment in segments:
+            append(segment.text)
+        return " ".join(parts).strip()